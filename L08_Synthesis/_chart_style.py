@@ -0,0 +1,35 @@
+"""Shared matplotlib style for the L08 synthesis charts.
+
+Chart scripts import the color constants and call ``apply_style()`` instead
+of repeating the rcParams block; the shared settings are only written when
+the live rcParams do not already hold them, so scripts executed back-to-back
+in one build reuse them (and a runner that restores rcParams between charts
+gets them re-applied). pyplot is only imported by ``apply_style()``, so
+importing just the colors stays cheap.
+"""
+MLPURPLE = '#3333B2'
+MLBLUE = '#0066CC'
+MLORANGE = '#FF7F0E'
+MLGREEN = '#2CA02C'
+MLRED = '#D62728'
+MLLAVENDER = '#ADADE0'
+
+PALETTE = (MLPURPLE, MLBLUE, MLORANGE, MLGREEN, MLRED, MLLAVENDER)
+
+RC_PARAMS = {
+    'font.size': 11, 'axes.labelsize': 11, 'axes.titlesize': 13,
+    'xtick.labelsize': 10, 'ytick.labelsize': 10, 'legend.fontsize': 9,
+    'figure.dpi': 150,
+    'path.simplify': True, 'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+}
+
+
+def apply_style(overrides=None):
+    """Apply the shared rcParams (when not already in effect) plus per-chart overrides"""
+    import matplotlib.pyplot as plt
+
+    if any(plt.rcParams[key] != value for key, value in RC_PARAMS.items()):
+        plt.rcParams.update(RC_PARAMS)
+    if overrides:
+        plt.rcParams.update(overrides)
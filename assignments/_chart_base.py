@@ -0,0 +1,47 @@
+"""Shared scaffold for the assignment ``chart_varied.py`` scripts.
+
+Holds the color constants, the common rcParams, the 2x2 figure setup and
+the PDF+PNG save, so each lesson script only contains its model and panels.
+pyplot is imported inside the helpers, so importing just the constants stays cheap.
+"""
+MLPURPLE = '#3333B2'
+MLBLUE = '#0066CC'
+MLORANGE = '#FF7F0E'
+MLGREEN = '#2CA02C'
+MLRED = '#D62728'
+MLLAVENDER = '#ADADE0'
+
+COLORS = {
+    'purple': MLPURPLE, 'blue': MLBLUE, 'orange': MLORANGE,
+    'green': MLGREEN, 'red': MLRED, 'lavender': MLLAVENDER,
+}
+
+RC = {
+    'font.size': 11, 'axes.labelsize': 11, 'axes.titlesize': 12,
+    'xtick.labelsize': 10, 'ytick.labelsize': 10, 'legend.fontsize': 9,
+    'figure.figsize': (16, 12), 'figure.dpi': 100
+}
+
+# PNGs are web/slide previews; the PDF carries the full-resolution vector output
+PNG_DPI = 100
+
+
+def make_2x2(rc_overrides=None, figsize=(16, 12)):
+    """Apply the shared rcParams (plus per-lesson overrides) and create a 2x2 figure"""
+    import matplotlib.pyplot as plt
+    plt.rcParams.update(RC)
+    if rc_overrides:
+        plt.rcParams.update(rc_overrides)
+    return plt.subplots(2, 2, figsize=figsize)
+
+
+def save_both(fig, path_stem):
+    """Save ``<path_stem>.pdf`` and ``.png`` at the fixed figure size
+
+    Callers run ``tight_layout()`` first, so the figure is already laid out
+    edge to edge and no tight-bbox pass is needed at save time.
+    """
+    import matplotlib.pyplot as plt
+    fig.savefig(f'{path_stem}.pdf', dpi=300)
+    fig.savefig(f'{path_stem}.png', dpi=PNG_DPI)
+    plt.close(fig)
@@ -10,53 +10,80 @@ Variations:
 3. Zero CBDC rate (all r_CBDC=0%)
 4. Early crisis (crisis starts quarter 2 instead of 8)
 """
+import sys
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless render: skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
-from scipy.integrate import odeint
 
-np.random.seed(42)
-
-plt.rcParams.update({
-    'font.size': 11, 'axes.labelsize': 11, 'axes.titlesize': 12,
-    'xtick.labelsize': 10, 'ytick.labelsize': 10, 'legend.fontsize': 9,
-    'figure.figsize': (16, 12), 'figure.dpi': 150
-})
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _chart_base import MLPURPLE, MLBLUE, MLORANGE, MLGREEN, MLRED, make_2x2, save_both
 
-MLPURPLE = '#3333B2'
-MLBLUE = '#0066CC'
-MLORANGE = '#FF7F0E'
-MLGREEN = '#2CA02C'
-MLRED = '#D62728'
+np.random.seed(42)
 
-def deposit_dynamics(D, t, r_cbdc, r_deposit, alpha, beta, crisis_start, crisis_duration):
+def analytic_deposits(t, r_cbdc, r_deposit, alpha, beta, crisis_start, crisis_duration, D0):
     """
-    Deposit flight differential equation.
+    Closed-form deposit paths for several scenarios at once.
+
+    dD/dt = a*D + b(t) with a = -alpha*(r_cbdc - r_deposit) and forcing
+    b = beta*(-5) during the crisis (0 otherwise) is linear with constant
+    coefficients on each piece, so every piece is an exact exponential:
+    D(t) = D_s*exp(a*dt) + b*expm1(a*dt)/a, which tends to D_s + b*dt as a -> 0.
 
     Parameters:
-    - D: current deposit level (% of initial)
-    - t: time (quarters)
-    - r_cbdc: CBDC interest rate
+    - t: time grid (quarters), shape (T,)
+    - r_cbdc: CBDC interest rate per scenario, shape (S,)
     - r_deposit: bank deposit rate
     - alpha: rate sensitivity parameter
     - beta: confidence parameter
-    - crisis_start: quarter when crisis begins (if applicable)
-    - crisis_duration: length of crisis shock
-    """
-    # Confidence shock during crisis
-    if crisis_start is not None and crisis_start <= t < crisis_start + crisis_duration:
-        confidence_shock = -5.0  # Sharp confidence loss
-    else:
-        confidence_shock = 0.0
+    - crisis_start: quarter when crisis begins per scenario, shape (S,)
+    - crisis_duration: length of crisis shock per scenario (0 = no crisis), shape (S,)
+    - D0: initial deposit level (% of initial)
 
+    Returns deposits of shape (T, S), one column per scenario.
+    """
+    t = t[:, None]
     # Rate differential effect
-    rate_effect = -alpha * (r_cbdc - r_deposit) * D
+    a = -alpha * (np.asarray(r_cbdc) - r_deposit)
+    # Confidence effect: sharp confidence loss during the crisis
+    b = beta * -5.0
+    crisis_start = np.asarray(crisis_start, dtype=float)
+    crisis_end = crisis_start + crisis_duration
+
+    def forced(D_start, dt):
+        growth = np.where(a == 0, dt, np.expm1(a * dt) / np.where(a == 0, 1.0, a))
+        return D_start * np.exp(a * dt) + b * growth
+
+    D_start = D0 * np.exp(a * crisis_start)
+    D_end = forced(D_start, np.asarray(crisis_duration, dtype=float))
+    return np.where(t < crisis_start, D0 * np.exp(a * t),
+                    np.where(t < crisis_end, forced(D_start, t - crisis_start),
+                             D_end * np.exp(a * (t - crisis_end))))
+
+
+def scenario_deposits(scenarios, alpha):
+    """Deposit paths for a list of scenario dicts, shape (T, len(scenarios))"""
+    r_cbdc = [scenario['r_cbdc'] for scenario in scenarios]
+    # A scenario without a crisis is a zero-length crisis at t=0
+    crisis_start = [scenario['crisis'] or 0 for scenario in scenarios]
+    crisis_duration = [3 if scenario['crisis'] is not None else 0 for scenario in scenarios]
+    return analytic_deposits(t, r_cbdc, r_deposit, alpha, beta,
+                             crisis_start, crisis_duration, D0)
+
+
+def _style(ax, title):
+    """Shared panel template: tipping-point line, labels, legend, grid and limits"""
+    ax.axhline(70, color='gray', linestyle=':', linewidth=1, alpha=0.7)
+    ax.text(19.5, 72, 'Tipping Point', ha='right', fontsize=9, color='gray', style='italic')
+    ax.set_xlabel('Time (Quarters)', fontweight='bold')
+    ax.set_ylabel('Bank Deposits (% of Initial)', fontweight='bold')
+    ax.set_title(title, fontsize=12, fontweight='bold', color=MLPURPLE)
+    ax.legend(loc='lower left', framealpha=0.95)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.set_xlim(0, 20)
+    ax.set_ylim(0, 105)
 
-    # Confidence effect
-    confidence_effect = beta * confidence_shock
-
-    dDdt = rate_effect + confidence_effect
-    return dDdt
 
 # Time grid: 20 quarters (5 years)
 t = np.linspace(0, 20, 200)
@@ -75,50 +102,24 @@ scenarios_base = [
     {'name': 'D: Crisis+1%', 'r_cbdc': 0.01, 'crisis': 8, 'color': MLRED, 'style': '--'},
 ]
 
-fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+fig, ((ax1, ax2), (ax3, ax4)) = make_2x2()
 
 # Panel 1: BASELINE (α=0.8, original scenarios)
-for scenario in scenarios_base:
-    crisis_start = scenario['crisis']
-    crisis_duration = 3 if crisis_start is not None else 0
-
-    D = odeint(deposit_dynamics, D0, t,
-               args=(scenario['r_cbdc'], r_deposit, alpha_base, beta, crisis_start, crisis_duration))
-
+D_all = scenario_deposits(scenarios_base, alpha_base)
+for scenario, D in zip(scenarios_base, D_all.T):
     ax1.plot(t, D, label=scenario['name'], color=scenario['color'],
              linewidth=2.5, linestyle=scenario['style'])
 
-ax1.axhline(70, color='gray', linestyle=':', linewidth=1, alpha=0.7)
-ax1.text(19.5, 72, 'Tipping Point', ha='right', fontsize=9, color='gray', style='italic')
-ax1.set_xlabel('Time (Quarters)', fontweight='bold')
-ax1.set_ylabel('Bank Deposits (% of Initial)', fontweight='bold')
-ax1.set_title('Panel 1: BASELINE (α=0.8, original scenarios)', fontsize=12, fontweight='bold', color=MLPURPLE)
-ax1.legend(loc='lower left', framealpha=0.95)
-ax1.grid(True, alpha=0.3, linestyle='--')
-ax1.set_xlim(0, 20)
-ax1.set_ylim(0, 105)
+_style(ax1, 'Panel 1: BASELINE (α=0.8, original scenarios)')
 
 # Panel 2: VARIATION 1 — High rate sensitivity (α=2.0)
 alpha_high = 2.0
-for scenario in scenarios_base:
-    crisis_start = scenario['crisis']
-    crisis_duration = 3 if crisis_start is not None else 0
-
-    D = odeint(deposit_dynamics, D0, t,
-               args=(scenario['r_cbdc'], r_deposit, alpha_high, beta, crisis_start, crisis_duration))
-
+D_all = scenario_deposits(scenarios_base, alpha_high)
+for scenario, D in zip(scenarios_base, D_all.T):
     ax2.plot(t, D, label=scenario['name'], color=scenario['color'],
              linewidth=2.5, linestyle=scenario['style'])
 
-ax2.axhline(70, color='gray', linestyle=':', linewidth=1, alpha=0.7)
-ax2.text(19.5, 72, 'Tipping Point', ha='right', fontsize=9, color='gray', style='italic')
-ax2.set_xlabel('Time (Quarters)', fontweight='bold')
-ax2.set_ylabel('Bank Deposits (% of Initial)', fontweight='bold')
-ax2.set_title('Panel 2: VARIATION 1 — High Rate Sensitivity (α=2.0)', fontsize=12, fontweight='bold', color=MLPURPLE)
-ax2.legend(loc='lower left', framealpha=0.95)
-ax2.grid(True, alpha=0.3, linestyle='--')
-ax2.set_xlim(0, 20)
-ax2.set_ylim(0, 105)
+_style(ax2, 'Panel 2: VARIATION 1 — High Rate Sensitivity (α=2.0)')
 
 # Panel 3: VARIATION 2 — All CBDC rates set to 0%
 scenarios_zero = [
@@ -128,25 +129,12 @@ scenarios_zero = [
     {'name': 'D: Crisis+0%', 'r_cbdc': 0.0, 'crisis': 8, 'color': MLRED, 'style': '--'},
 ]
 
-for scenario in scenarios_zero:
-    crisis_start = scenario['crisis']
-    crisis_duration = 3 if crisis_start is not None else 0
-
-    D = odeint(deposit_dynamics, D0, t,
-               args=(scenario['r_cbdc'], r_deposit, alpha_base, beta, crisis_start, crisis_duration))
-
+D_all = scenario_deposits(scenarios_zero, alpha_base)
+for scenario, D in zip(scenarios_zero, D_all.T):
     ax3.plot(t, D, label=scenario['name'], color=scenario['color'],
              linewidth=2.5, linestyle=scenario['style'])
 
-ax3.axhline(70, color='gray', linestyle=':', linewidth=1, alpha=0.7)
-ax3.text(19.5, 72, 'Tipping Point', ha='right', fontsize=9, color='gray', style='italic')
-ax3.set_xlabel('Time (Quarters)', fontweight='bold')
-ax3.set_ylabel('Bank Deposits (% of Initial)', fontweight='bold')
-ax3.set_title('Panel 3: VARIATION 2 — Zero CBDC Rate (all r_CBDC=0%)', fontsize=12, fontweight='bold', color=MLPURPLE)
-ax3.legend(loc='lower left', framealpha=0.95)
-ax3.grid(True, alpha=0.3, linestyle='--')
-ax3.set_xlim(0, 20)
-ax3.set_ylim(0, 105)
+_style(ax3, 'Panel 3: VARIATION 2 — Zero CBDC Rate (all r_CBDC=0%)')
 
 # Panel 4: VARIATION 3 — Early crisis (quarter 2 instead of 8)
 scenarios_early = [
@@ -156,13 +144,8 @@ scenarios_early = [
     {'name': 'D: Crisis+1% (Q2)', 'r_cbdc': 0.01, 'crisis': 2, 'color': MLRED, 'style': '--'},
 ]
 
-for scenario in scenarios_early:
-    crisis_start = scenario['crisis']
-    crisis_duration = 3 if crisis_start is not None else 0
-
-    D = odeint(deposit_dynamics, D0, t,
-               args=(scenario['r_cbdc'], r_deposit, alpha_base, beta, crisis_start, crisis_duration))
-
+D_all = scenario_deposits(scenarios_early, alpha_base)
+for scenario, D in zip(scenarios_early, D_all.T):
     ax4.plot(t, D, label=scenario['name'], color=scenario['color'],
              linewidth=2.5, linestyle=scenario['style'])
 
@@ -170,15 +153,7 @@ for scenario in scenarios_early:
 ax4.axvspan(2, 5, alpha=0.1, color=MLRED)
 ax4.text(3.5, 5, 'Crisis (Q2-Q5)', ha='center', fontsize=9, color=MLRED, style='italic')
 
-ax4.axhline(70, color='gray', linestyle=':', linewidth=1, alpha=0.7)
-ax4.text(19.5, 72, 'Tipping Point', ha='right', fontsize=9, color='gray', style='italic')
-ax4.set_xlabel('Time (Quarters)', fontweight='bold')
-ax4.set_ylabel('Bank Deposits (% of Initial)', fontweight='bold')
-ax4.set_title('Panel 4: VARIATION 3 — Early Crisis (quarter 2 instead of 8)', fontsize=12, fontweight='bold', color=MLPURPLE)
-ax4.legend(loc='lower left', framealpha=0.95)
-ax4.grid(True, alpha=0.3, linestyle='--')
-ax4.set_xlim(0, 20)
-ax4.set_ylim(0, 105)
+_style(ax4, 'Panel 4: VARIATION 3 — Early Crisis (quarter 2 instead of 8)')
 
 # Add overall caption
 fig.text(0.5, 0.01,
@@ -187,7 +162,5 @@ fig.text(0.5, 0.01,
          ha='center', fontsize=9, style='italic', color='gray')
 
 plt.tight_layout(rect=[0, 0.03, 1, 1])
-plt.savefig(Path(__file__).parent / 'chart_varied.pdf', dpi=300, bbox_inches='tight')
-plt.savefig(Path(__file__).parent / 'chart_varied.png', dpi=150, bbox_inches='tight')
-plt.close()
+save_both(fig, Path(__file__).parent / 'chart_varied')
 print("Variation chart saved to chart_varied.pdf and chart_varied.png")
@@ -14,42 +14,46 @@ Economic Model:
     Models: Metcalfe $V = \frac{n^2}{1000}$, Odlyzko-Tilly
     $V = \frac{n \ln(n)}{10}$, Linear $V = n$, Reed $V = 2^{n/10}$
 """
+import sys
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless render: skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _chart_base import MLPURPLE, MLBLUE, MLORANGE, MLRED, make_2x2, save_both
+
 np.random.seed(42)
 
-plt.rcParams.update({
-    'font.size': 11, 'axes.labelsize': 11, 'axes.titlesize': 12,
-    'xtick.labelsize': 10, 'ytick.labelsize': 10, 'legend.fontsize': 9,
-    'figure.figsize': (16, 12), 'figure.dpi': 150
-})
-
-MLPURPLE = '#3333B2'
-MLBLUE = '#0066CC'
-MLORANGE = '#FF7F0E'
-MLGREEN = '#2CA02C'
-MLRED = '#D62728'
 MLMAGENTA = '#9467BD'
 
 # Simulation parameters
 n = np.arange(1, 1001)
 
 # Network value models
-V_metcalfe = n**2 / 1000
-V_odlyzko = n * np.log(n) / 10
+V_metcalfe = (n * n) * 1e-3
+V_odlyzko = n * np.log(n) * 0.1
 V_linear = n
-V_reed = 2**(n/10)  # Reed's Law for variation 3
 
 # Create 2x2 subplot
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+fig, axes = make_2x2()
 axes = axes.flatten()
 
 # Helper function to find critical mass
-def find_critical_mass(V, threshold, n):
-    idx = np.where(V > threshold)[0]
-    return n[idx[0]] if len(idx) > 0 else None
+def find_critical_mass(V, thresholds, n):
+    # Every value curve is increasing in n, so binary-search the first V > threshold
+    # for all thresholds at once; None where the curve never crosses
+    idx = np.searchsorted(V, thresholds, side='right')
+    return [n[i] if i < len(n) else None for i in idx]
+
+# Critical masses of the shared curves for every switching cost used below,
+# looked up once instead of once per panel
+thresholds = [500, 100, 2000]
+critical_mass = {
+    name: dict(zip(thresholds, find_critical_mass(V, thresholds, n)))
+    for name, V in [('metcalfe', V_metcalfe), ('odlyzko', V_odlyzko), ('linear', V_linear)]
+}
 
 # Helper function to plot network models
 def plot_network_models(ax, threshold, include_reed=False):
@@ -62,7 +66,11 @@ def plot_network_models(ax, threshold, include_reed=False):
             color=MLORANGE, linewidth=2)
 
     if include_reed:
-        ax.plot(n, V_reed, label=r"Reed's Law ($V = 2^{n/10}$)",
+        # Reed's Law for variation 3, only needed here. n < 200 already runs
+        # past the 1e4 plot ceiling, so the 2^100 tail is never materialized.
+        n_reed = np.arange(1, 200)
+        V_reed = np.exp2(n_reed * 0.1)
+        ax.plot(n_reed, V_reed, label=r"Reed's Law ($V = 2^{n/10}$)",
                 color=MLMAGENTA, linewidth=2)
 
     # Threshold line
@@ -70,9 +78,9 @@ def plot_network_models(ax, threshold, include_reed=False):
                linewidth=1.5, label=f'Switching Cost = {threshold}', alpha=0.8)
 
     # Find and mark critical mass points
-    critical_metcalfe = find_critical_mass(V_metcalfe, threshold, n)
-    critical_odlyzko = find_critical_mass(V_odlyzko, threshold, n)
-    critical_linear = find_critical_mass(V_linear, threshold, n)
+    critical_metcalfe = critical_mass['metcalfe'][threshold]
+    critical_odlyzko = critical_mass['odlyzko'][threshold]
+    critical_linear = critical_mass['linear'][threshold]
 
     if critical_metcalfe:
         ax.axvline(x=critical_metcalfe, color=MLPURPLE, linestyle=':',
@@ -99,7 +107,7 @@ def plot_network_models(ax, threshold, include_reed=False):
                 color=MLORANGE, fontsize=9, rotation=90, va='bottom', ha='right')
 
     if include_reed:
-        critical_reed = find_critical_mass(V_reed, threshold, n)
+        critical_reed, = find_critical_mass(V_reed, [threshold], n_reed)
         if critical_reed:
             ax.axvline(x=critical_reed, color=MLMAGENTA, linestyle=':',
                        linewidth=1, alpha=0.5)
@@ -167,7 +175,5 @@ plt.suptitle('Network Effects Variations: Sensitivity of Critical Mass to Switch
              fontsize=14, fontweight='bold', y=0.995)
 plt.tight_layout()
 
-plt.savefig(Path(__file__).parent / 'chart_varied.pdf', dpi=300, bbox_inches='tight')
-plt.savefig(Path(__file__).parent / 'chart_varied.png', dpi=150, bbox_inches='tight')
-plt.close()
+save_both(fig, Path(__file__).parent / 'chart_varied')
 print("Chart saved to chart_varied.pdf and chart_varied.png")
@@ -2,32 +2,52 @@
 
 Compares four scenarios to isolate drivers of market concentration.
 """
+import sys
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless render: skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
-plt.rcParams.update({
-    'font.size': 11, 'axes.labelsize': 11, 'axes.titlesize': 12,
-    'xtick.labelsize': 10, 'ytick.labelsize': 10, 'legend.fontsize': 9,
-    'figure.figsize': (16, 12), 'figure.dpi': 150
-})
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _chart_base import MLPURPLE, MLBLUE, MLORANGE, MLGREEN, MLRED, make_2x2, save_both
 
-MLPURPLE = '#3333B2'
-MLBLUE = '#0066CC'
-MLORANGE = '#FF7F0E'
-MLGREEN = '#2CA02C'
-MLRED = '#D62728'
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
-def gibrat_simulation(n_firms=100, n_periods=100, mu=0.02, sigma=0.25, failure_threshold=0.1):
+def _gibrat_kernel(shocks, mu, sigma, failure_threshold):
+    """Period loop of the Gibrat simulation, written straight into the history matrix."""
+    n_periods, n_firms = shocks.shape
+
+    sizes_history = np.empty((n_periods + 1, n_firms))
+    sizes_history[0] = 1.0
+
+    for t in range(1, n_periods + 1):
+        for i in range(n_firms):
+            # Gibrat's Law: proportional random growth
+            size = sizes_history[t - 1, i] * (1 + mu + sigma * shocks[t - 1, i])
+            # Firms below threshold fail
+            sizes_history[t, i] = size if size >= failure_threshold else 0.0
+
+    return sizes_history
+
+
+if HAS_NUMBA:
+    _gibrat_kernel = njit(cache=True)(_gibrat_kernel)
+
+
+def gibrat_simulation(shocks, mu=0.02, sigma=0.25, failure_threshold=0.1):
     """
     Simulate Gibrat's Law: Size_t = Size_{t-1} * (1 + eps_t), where eps_t ~ N(mu, sigma^2)
 
     Parameters:
     -----------
-    n_firms : int
-        Initial number of firms (platforms)
-    n_periods : int
-        Number of time periods to simulate
+    shocks : ndarray, shape (n_periods, n_firms)
+        Standard normal draws z, so that eps_t = mu + sigma * z_t; the shape sets
+        the number of periods and the initial number of firms (platforms)
     mu : float
         Mean growth rate (slight advantage for larger firms via drift)
     sigma : float
@@ -37,83 +57,65 @@ def gibrat_simulation(n_firms=100, n_periods=100, mu=0.02, sigma=0.25, failure_t
 
     Returns:
     --------
-    sizes_history : list of arrays
-        Size distribution at each time period
-    active_history : list of arrays
-        Boolean mask of active firms at each time period
+    sizes_history : ndarray, shape (n_periods + 1, n_firms)
+        Size distribution at each time period, one row per period;
+        exited firms have size 0, so the active mask is sizes_history > 0
     """
-    # Initialize with equal sizes
-    sizes = np.ones(n_firms)
-    sizes_history = [sizes.copy()]
-    active_history = [np.ones(n_firms, dtype=bool)]
-
-    for t in range(n_periods):
-        # Gibrat's Law: proportional random growth
-        growth_rates = 1 + np.random.normal(mu, sigma, n_firms)
-        sizes = sizes * growth_rates
-
-        # Firms below threshold fail
-        active = sizes >= failure_threshold
-        sizes[~active] = 0
-
-        sizes_history.append(sizes.copy())
-        active_history.append(active.copy())
-
-    return sizes_history, active_history
+    return _gibrat_kernel(shocks, mu, sigma, failure_threshold)
 
 def calculate_hhi(shares):
-    """Calculate Herfindahl-Hirschman Index (sum of squared market shares)"""
-    return np.sum(shares ** 2)
+    """Calculate Herfindahl-Hirschman Index (sum of squared market shares) along the last axis"""
+    return np.sum(shares ** 2, axis=-1)
 
 def calculate_gini(shares):
-    """Calculate Gini coefficient of market concentration"""
-    shares = shares[shares > 0]
-    if len(shares) == 0:
-        return 0
-    shares = np.sort(shares)
-    n = len(shares)
-    index = np.arange(1, n + 1)
-    return (np.sum((2 * index - n - 1) * shares)) / (n * np.sum(shares))
+    """Calculate Gini coefficient of market concentration among active firms, along the last axis
+
+    Zero shares are exited firms and are left out, so each row is ranked
+    among its own active firms only; rows with no active firm give 0.
+    """
+    shares = np.sort(shares, axis=-1)
+    n_total = shares.shape[-1]
+    n = np.count_nonzero(shares > 0, axis=-1)[..., None]
+    # Zeros sort first, so the active firms hold ranks 1..n at the top of each row
+    index = np.arange(1, n_total + 1) - (n_total - n)
+    numerator = np.sum((2 * index - n - 1) * shares, axis=-1)
+    denominator = n[..., 0] * np.sum(shares, axis=-1)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
 
 # Create 2x2 subplot
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+fig, axes = make_2x2()
 axes = axes.flatten()
 
 scenarios = [
-    {'name': 'Baseline', 'n_firms': 100, 'mu': 0.02, 'sigma': 0.25, 'seed': 42, 'color_hhi': MLBLUE, 'color_gini': MLORANGE},
-    {'name': 'Variation 1: Low Volatility', 'n_firms': 100, 'mu': 0.02, 'sigma': 0.05, 'seed': 42, 'color_hhi': MLGREEN, 'color_gini': MLRED},
-    {'name': 'Variation 2: High Mean Growth', 'n_firms': 100, 'mu': 0.10, 'sigma': 0.25, 'seed': 42, 'color_hhi': MLPURPLE, 'color_gini': MLORANGE},
-    {'name': 'Variation 3: Fewer Firms', 'n_firms': 10, 'mu': 0.02, 'sigma': 0.25, 'seed': 42, 'color_hhi': MLRED, 'color_gini': MLGREEN}
+    {'name': 'Baseline', 'n_firms': 100, 'mu': 0.02, 'sigma': 0.25, 'color_hhi': MLBLUE, 'color_gini': MLORANGE},
+    {'name': 'Variation 1: Low Volatility', 'n_firms': 100, 'mu': 0.02, 'sigma': 0.05, 'color_hhi': MLGREEN, 'color_gini': MLRED},
+    {'name': 'Variation 2: High Mean Growth', 'n_firms': 100, 'mu': 0.10, 'sigma': 0.25, 'color_hhi': MLPURPLE, 'color_gini': MLORANGE},
+    {'name': 'Variation 3: Fewer Firms', 'n_firms': 10, 'mu': 0.02, 'sigma': 0.25, 'color_hhi': MLRED, 'color_gini': MLGREEN}
 ]
 
+# Seeding convention: one Generator (PCG64, seed 42) fills a single block of
+# standard normal shocks up front. Every scenario reads the same shocks (the
+# first n_firms columns), so panels differ only by their parameters.
+N_PERIODS = 100
+shocks = np.random.default_rng(42).standard_normal(
+    (N_PERIODS, max(scenario['n_firms'] for scenario in scenarios)))
+
 for idx, scenario in enumerate(scenarios):
     ax = axes[idx]
 
-    # Set seed for reproducibility
-    np.random.seed(scenario['seed'])
-
     # Run simulation
-    sizes_history, active_history = gibrat_simulation(
-        n_firms=scenario['n_firms'],
-        n_periods=100,
+    sizes_history = gibrat_simulation(
+        shocks[:, :scenario['n_firms']],
         mu=scenario['mu'],
         sigma=scenario['sigma'],
         failure_threshold=0.1
     )
 
-    # Calculate metrics over time
-    hhi_history = []
-    gini_history = []
-
-    for sizes in sizes_history:
-        active_sizes = sizes[sizes > 0]
-        if len(active_sizes) > 0:
-            shares = active_sizes / np.sum(active_sizes)
-            hhi_history.append(calculate_hhi(shares))
-            gini_history.append(calculate_gini(shares))
-        else:
-            hhi_history.append(0)
-            gini_history.append(0)
+    # Calculate metrics over time: shares of active firms, one row per period
+    totals = sizes_history.sum(axis=1, keepdims=True)
+    shares = np.divide(sizes_history, totals, out=np.zeros_like(sizes_history), where=totals > 0)
+    hhi_history = calculate_hhi(shares)
+    gini_history = calculate_gini(shares)
 
     # Plot HHI on left y-axis
     ax_twin = ax.twinx()
@@ -151,7 +153,5 @@ fig.suptitle('Gibrat\'s Law: How Growth Parameters Affect Market Concentration',
              fontsize=15, fontweight='bold', y=0.995)
 
 plt.tight_layout()
-plt.savefig(Path(__file__).parent / 'chart_varied.pdf', dpi=300, bbox_inches='tight')
-plt.savefig(Path(__file__).parent / 'chart_varied.png', dpi=150, bbox_inches='tight')
-plt.close()
+save_both(fig, Path(__file__).parent / 'chart_varied')
 print("Variation chart saved to chart_varied.pdf and chart_varied.png")
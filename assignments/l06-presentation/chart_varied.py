@@ -1,28 +1,25 @@
 """AMM Constant Product Variations — Assignment A6
 2x2 subplot showing baseline, deep pool, imbalanced pool, and fee comparison
 """
+import sys
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless render: skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
-np.random.seed(42)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _chart_base import MLPURPLE, MLBLUE, MLORANGE, MLGREEN, MLRED, MLLAVENDER, make_2x2, save_both
 
-plt.rcParams.update({
-    'font.size': 12, 'axes.labelsize': 12, 'axes.titlesize': 14,
-    'xtick.labelsize': 11, 'ytick.labelsize': 11, 'legend.fontsize': 10,
-    'figure.dpi': 150
-})
+np.random.seed(42)
 
-MLPURPLE = '#3333B2'
-MLBLUE = '#0066CC'
-MLORANGE = '#FF7F0E'
-MLGREEN = '#2CA02C'
-MLRED = '#D62728'
-MLLAVENDER = '#ADADE0'
+# Callout box per trade color, built once and shared by every trade label
+CALLOUT_BBOX = {c: dict(boxstyle='round,pad=0.3', fc='white', ec=c, alpha=0.9)
+                for c in (MLORANGE, MLRED, MLGREEN)}
 
 # --- Trade computation helper ---
 def trade_buy_x(k, x_pool, y_pool, dx_out, fee=0.0):
-    """Buy dx_out of token X from the pool.
+    """Buy dx_out of token X from the pool (scalar or array of trade sizes).
     fee: fraction of output taken as fee (e.g., 0.003 for 0.3%)
     """
     new_x = x_pool - dx_out
@@ -30,11 +27,30 @@ def trade_buy_x(k, x_pool, y_pool, dx_out, fee=0.0):
     cost_y = new_y - y_pool
     # Apply fee to the amount received (reduce dx_out)
     dx_out_effective = dx_out * (1 - fee)
-    effective_price = cost_y / dx_out_effective if dx_out_effective > 0 else cost_y / dx_out
+    effective_price = cost_y / np.where(dx_out_effective > 0, dx_out_effective, dx_out)
     return new_x, new_y, effective_price
 
+# --- Shared template for the reserve-curve panels ---
+def _style(ax, xlim, ylim, title):
+    """Label, limit and grid one x*y=k reserve panel"""
+    ax.set_xlabel('Token X reserve')
+    ax.set_ylabel('Token Y reserve')
+    ax.set_title(title)
+    ax.legend(loc='upper right', fontsize=9)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
+    ax.grid(True, alpha=0.3)
+
+def _trade_arrows(ax, x0, y0, new_x, new_y, colors):
+    """Draw every trade arrow from the start point as one quiver artist"""
+    new_x, new_y = np.asarray(new_x), np.asarray(new_y)
+    ax.quiver(np.full(new_x.shape, x0), np.full(new_y.shape, y0), new_x - x0, new_y - y0,
+              color=colors, angles='xy', scale_units='xy', scale=1,
+              width=0.004, headwidth=4, headlength=5, headaxislength=4.5, zorder=4)
+
 # --- Create 2x2 subplot grid ---
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+fig, axes = make_2x2({'font.size': 12, 'axes.labelsize': 12, 'axes.titlesize': 14,
+                     'xtick.labelsize': 11, 'ytick.labelsize': 11, 'legend.fontsize': 10})
 ax1, ax2, ax3, ax4 = axes[0, 0], axes[0, 1], axes[1, 0], axes[1, 1]
 
 # ============================================
@@ -44,32 +60,27 @@ k1 = 1_000_000
 x0_1, y0_1 = 1000, 1000
 spot_price_1 = y0_1 / x0_1
 
-x_curve_1 = np.linspace(200, 3500, 800)
+# Log-spaced samples resolve the hyperbola evenly along its length
+x_curve_1 = np.geomspace(200, 3500, 200)
 y_curve_1 = k1 / x_curve_1
 
 ax1.plot(x_curve_1, y_curve_1, color=MLPURPLE, lw=2.5, label=r'$x \cdot y = 10^6$')
 ax1.plot(x0_1, y0_1, 'o', color=MLBLUE, ms=10, zorder=5, label=f'Start ({x0_1}, {y0_1}), P={spot_price_1:.1f}')
 
-# Trade arrows for 100 and 500
-trades_1 = [100, 500]
+# Trade arrows for 100 and 500: endpoints and slippage for both trades at once
+trades_1 = np.array([100, 500])
 trade_colors = [MLORANGE, MLRED]
 
-for dx_out, col in zip(trades_1, trade_colors):
-    nx, ny, ep = trade_buy_x(k1, x0_1, y0_1, dx_out)
-    ax1.annotate('', xy=(nx, ny), xytext=(x0_1, y0_1),
-                 arrowprops=dict(arrowstyle='->', color=col, lw=2))
-    ax1.plot(nx, ny, 's', color=col, ms=8, zorder=5)
-    slip = (ep - spot_price_1) / spot_price_1 * 100
+new_x_1, new_y_1, ep_1 = trade_buy_x(k1, x0_1, y0_1, trades_1)
+slip_1 = (ep_1 - spot_price_1) / spot_price_1 * 100
+
+_trade_arrows(ax1, x0_1, y0_1, new_x_1, new_y_1, trade_colors)
+ax1.scatter(new_x_1, new_y_1, c=trade_colors, marker='s', s=64, zorder=5)
+for dx_out, nx, ny, slip, col in zip(trades_1, new_x_1, new_y_1, slip_1, trade_colors):
     ax1.text(nx - 200, ny + 100, f'Buy {dx_out} X\nslip {slip:.1f}%',
-             fontsize=9, color=col, bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=col, alpha=0.9))
+             fontsize=9, color=col, bbox=CALLOUT_BBOX[col])
 
-ax1.set_xlabel('Token X reserve')
-ax1.set_ylabel('Token Y reserve')
-ax1.set_title('BASELINE: k = 1M, balanced pool')
-ax1.legend(loc='upper right', fontsize=9)
-ax1.set_xlim(200, 3500)
-ax1.set_ylim(200, 3500)
-ax1.grid(True, alpha=0.3)
+_style(ax1, (200, 3500), (200, 3500), 'BASELINE: k = 1M, balanced pool')
 
 # ============================================
 # PANEL 2: VARIATION 1 (k=10M, deeper pool)
@@ -78,29 +89,23 @@ k2 = 10_000_000
 x0_2, y0_2 = int(np.sqrt(k2)), int(np.sqrt(k2))  # ~3162 each
 spot_price_2 = y0_2 / x0_2
 
-x_curve_2 = np.linspace(500, 10000, 800)
+x_curve_2 = np.geomspace(500, 10000, 200)
 y_curve_2 = k2 / x_curve_2
 
 ax2.plot(x_curve_2, y_curve_2, color=MLGREEN, lw=2.5, label=r'$x \cdot y = 10^7$')
 ax2.plot(x0_2, y0_2, 'o', color=MLBLUE, ms=10, zorder=5, label=f'Start ({x0_2}, {y0_2}), P={spot_price_2:.2f}')
 
 # Same trades (100, 500) on deeper pool
-for dx_out, col in zip(trades_1, trade_colors):
-    nx, ny, ep = trade_buy_x(k2, x0_2, y0_2, dx_out)
-    ax2.annotate('', xy=(nx, ny), xytext=(x0_2, y0_2),
-                 arrowprops=dict(arrowstyle='->', color=col, lw=2))
-    ax2.plot(nx, ny, 's', color=col, ms=8, zorder=5)
-    slip = (ep - spot_price_2) / spot_price_2 * 100
+new_x_2, new_y_2, ep_2 = trade_buy_x(k2, x0_2, y0_2, trades_1)
+slip_2 = (ep_2 - spot_price_2) / spot_price_2 * 100
+
+_trade_arrows(ax2, x0_2, y0_2, new_x_2, new_y_2, trade_colors)
+ax2.scatter(new_x_2, new_y_2, c=trade_colors, marker='s', s=64, zorder=5)
+for dx_out, nx, ny, slip, col in zip(trades_1, new_x_2, new_y_2, slip_2, trade_colors):
     ax2.text(nx - 300, ny + 200, f'Buy {dx_out} X\nslip {slip:.1f}%',
-             fontsize=9, color=col, bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=col, alpha=0.9))
+             fontsize=9, color=col, bbox=CALLOUT_BBOX[col])
 
-ax2.set_xlabel('Token X reserve')
-ax2.set_ylabel('Token Y reserve')
-ax2.set_title('VARIATION 1: k = 10M (10x deeper) — reduced slippage')
-ax2.legend(loc='upper right', fontsize=9)
-ax2.set_xlim(500, 10000)
-ax2.set_ylim(500, 10000)
-ax2.grid(True, alpha=0.3)
+_style(ax2, (500, 10000), (500, 10000), 'VARIATION 1: k = 10M (10x deeper) — reduced slippage')
 
 # ============================================
 # PANEL 3: VARIATION 2 (imbalanced pool)
@@ -109,7 +114,7 @@ k3 = 1_000_000
 x0_3, y0_3 = 500, 2000  # Initial price = 4.0
 spot_price_3 = y0_3 / x0_3
 
-x_curve_3 = np.linspace(100, 3000, 800)
+x_curve_3 = np.geomspace(100, 3000, 200)
 y_curve_3 = k3 / x_curve_3
 
 ax3.plot(x_curve_3, y_curve_3, color=MLPURPLE, lw=2.5, label=r'$x \cdot y = 10^6$')
@@ -119,11 +124,9 @@ ax3.plot(x0_3, y0_3, 'o', color=MLRED, ms=10, zorder=5, label=f'Start ({x0_3}, {
 # Buy 100 X (expensive direction)
 nx_x, ny_x, ep_x = trade_buy_x(k3, x0_3, y0_3, 100)
 slip_x = (ep_x - spot_price_3) / spot_price_3 * 100
-ax3.annotate('', xy=(nx_x, ny_x), xytext=(x0_3, y0_3),
-             arrowprops=dict(arrowstyle='->', color=MLORANGE, lw=2))
 ax3.plot(nx_x, ny_x, 's', color=MLORANGE, ms=8, zorder=5)
 ax3.text(nx_x - 150, ny_x + 200, f'Buy 100 X\nslip {slip_x:.1f}%\n(scarce asset)',
-         fontsize=9, color=MLORANGE, bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=MLORANGE, alpha=0.9))
+         fontsize=9, color=MLORANGE, bbox=CALLOUT_BBOX[MLORANGE])
 
 # Buy 400 Y (cheap direction) — simulate by selling X to get Y
 # Reverse trade: add X, remove Y
@@ -133,19 +136,12 @@ new_x_rev = k3 / new_y_rev
 cost_x = new_x_rev - x0_3
 ep_y = cost_x / dy_out
 slip_y = (ep_y - (1/spot_price_3)) / (1/spot_price_3) * 100
-ax3.annotate('', xy=(new_x_rev, new_y_rev), xytext=(x0_3, y0_3),
-             arrowprops=dict(arrowstyle='->', color=MLGREEN, lw=2))
+_trade_arrows(ax3, x0_3, y0_3, [nx_x, new_x_rev], [ny_x, new_y_rev], [MLORANGE, MLGREEN])
 ax3.plot(new_x_rev, new_y_rev, '^', color=MLGREEN, ms=8, zorder=5)
 ax3.text(new_x_rev + 50, new_y_rev - 200, f'Buy 400 Y\nslip {slip_y:.1f}%\n(abundant asset)',
-         fontsize=9, color=MLGREEN, bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=MLGREEN, alpha=0.9))
+         fontsize=9, color=MLGREEN, bbox=CALLOUT_BBOX[MLGREEN])
 
-ax3.set_xlabel('Token X reserve')
-ax3.set_ylabel('Token Y reserve')
-ax3.set_title('VARIATION 2: Imbalanced pool (x₀=500, y₀=2000, P=4.0)')
-ax3.legend(loc='upper right', fontsize=9)
-ax3.set_xlim(100, 2500)
-ax3.set_ylim(200, 3500)
-ax3.grid(True, alpha=0.3)
+_style(ax3, (100, 2500), (200, 3500), 'VARIATION 2: Imbalanced pool (x₀=500, y₀=2000, P=4.0)')
 
 # ============================================
 # PANEL 4: VARIATION 3 (fee comparison)
@@ -154,20 +150,13 @@ k4 = 1_000_000
 x0_4, y0_4 = 1000, 1000
 spot_price_4 = y0_4 / x0_4
 
-trade_sizes = [10, 50, 100, 200, 500]
-slippages_no_fee = []
-slippages_with_fee = []
-
-for s in trade_sizes:
-    # No fee
-    _, _, ep_no_fee = trade_buy_x(k4, x0_4, y0_4, s, fee=0.0)
-    slip_no_fee = (ep_no_fee - spot_price_4) / spot_price_4 * 100
-    slippages_no_fee.append(slip_no_fee)
+trade_sizes = np.array([10, 50, 100, 200, 500])
 
-    # With 0.3% fee
-    _, _, ep_with_fee = trade_buy_x(k4, x0_4, y0_4, s, fee=0.003)
-    slip_with_fee = (ep_with_fee - spot_price_4) / spot_price_4 * 100
-    slippages_with_fee.append(slip_with_fee)
+# Every trade size in one pass: the pool cost of buying dx X is k/(x0 - dx) - y0;
+# the 0.3% fee shrinks the X actually received, as in trade_buy_x
+cost_y_4 = k4 / (x0_4 - trade_sizes) - y0_4
+slippages_no_fee = (cost_y_4 / trade_sizes - spot_price_4) / spot_price_4 * 100
+slippages_with_fee = (cost_y_4 / (trade_sizes * (1 - 0.003)) - spot_price_4) / spot_price_4 * 100
 
 x_pos = np.arange(len(trade_sizes))
 width = 0.35
@@ -178,11 +167,8 @@ bars2 = ax4.bar(x_pos + width/2, slippages_with_fee, width, label='With 0.3% fee
                 color=MLORANGE, edgecolor=MLRED, lw=1.2)
 
 # Annotate bars
-for i, (no_fee, with_fee) in enumerate(zip(slippages_no_fee, slippages_with_fee)):
-    ax4.text(x_pos[i] - width/2, no_fee + 1, f'{no_fee:.1f}%',
-             ha='center', va='bottom', fontsize=9, color=MLPURPLE)
-    ax4.text(x_pos[i] + width/2, with_fee + 1, f'{with_fee:.1f}%',
-             ha='center', va='bottom', fontsize=9, color=MLRED)
+ax4.bar_label(bars1, fmt='%.1f%%', padding=2, fontsize=9, color=MLPURPLE)
+ax4.bar_label(bars2, fmt='%.1f%%', padding=2, fontsize=9, color=MLRED)
 
 ax4.set_xlabel('Trade size (tokens)')
 ax4.set_ylabel('Slippage (%)')
@@ -201,7 +187,5 @@ ax4.text(0.98, 0.55, 'For large trades:\nSlippage >> Fees\n(100% vs 0.3%)',
 # Save figure
 # ============================================
 plt.tight_layout()
-plt.savefig(Path(__file__).parent / 'chart_varied.pdf', dpi=300, bbox_inches='tight')
-plt.savefig(Path(__file__).parent / 'chart_varied.png', dpi=150, bbox_inches='tight')
-plt.close()
+save_both(fig, Path(__file__).parent / 'chart_varied')
 print("Chart saved to chart_varied.pdf and chart_varied.png")
@@ -5,19 +5,42 @@ Collects repository statistics from GitHub API for Digital-AI-Finance organizati
 
 import os
 import json
+import hashlib
+import threading
 import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
+from urllib.parse import urlencode
 import time
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Response and cache bodies are decoded straight from bytes; orjson when available
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
 
 class GitHubDataFetcher:
     """Fetch and process GitHub repository data"""
 
-    def __init__(self, org_name: str, token: Optional[str] = None):
+    # Repositories aliased into one GraphQL commit-count query
+    GRAPHQL_BATCH_SIZE = 25
+
+    def __init__(self, org_name: str, token: Optional[str] = None, max_workers: int = 16,
+                 include_commit_details: bool = False, cache_dir: Optional[str] = None):
         self.org_name = org_name
+        self.max_workers = max_workers
+        # Commit payloads are only downloaded when asked for; counts come from GraphQL
+        self.include_commit_details = include_commit_details
         self.token = token or os.getenv('GITHUB_TOKEN')
         self.base_url = "https://api.github.com"
+        self.graphql_url = f"{self.base_url}/graphql"
         self.headers = {
             'Accept': 'application/vnd.github.v3+json'
         }
@@ -26,24 +49,129 @@ class GitHubDataFetcher:
 
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # Enough pooled connections for every worker thread to keep one open
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+
+        # Shared rate-limit state: the worker that sees the quota run low records
+        # the reset time, and the first to reach it sleeps while the rest queue
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_reset = 0.0
+
+        # Conditional-request cache: URL -> ETag index plus one body file per URL.
+        # Unchanged resources come back as 304s, which do not count against the quota
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'github_fetcher')
+        self._etag_path = os.path.join(self.cache_dir, 'etags.json')
+        self._etag_lock = threading.Lock()
+        self._etags = {}
+        if os.path.exists(self._etag_path):
+            try:
+                with open(self._etag_path, 'r', encoding='utf-8') as f:
+                    self._etags = json.load(f)
+            except (OSError, ValueError):
+                self._etags = {}
+
+    def _body_path(self, key: str) -> str:
+        """Path of the cached response body for a request key"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, 'bodies', f'{digest}.json')
+
+    def _load_cached_body(self, key: str):
+        """Return the cached body for a request key, or None if it is missing"""
+        try:
+            with open(self._body_path(key), 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_body(self, key: str, etag: str, body):
+        """Record a fresh ETag and its response body"""
+        path = self._body_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(body, f)
+        except OSError:
+            # Caching is best effort; an unwritable cache just means full downloads
+            return
+        with self._etag_lock:
+            self._etags[key] = etag
+
+    def save_etag_cache(self):
+        """Persist the URL -> ETag index for the next run"""
+        with self._etag_lock:
+            etags = dict(self._etags)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._etag_path, 'w', encoding='utf-8') as f:
+                json.dump(etags, f, indent=2)
+        except OSError as e:
+            print(f"Could not save ETag cache: {e}")
+
+    def _wait_for_rate_limit(self):
+        """Block until the recorded rate-limit reset time has passed"""
+        with self._rate_limit_lock:
+            wait_time = self._rate_limit_reset - time.time()
+            if wait_time > 0:
+                print(f"Rate limit low. Waiting {wait_time:.0f} seconds...")
+                time.sleep(wait_time)
+
+    def _check_rate_limit(self, response):
+        """Record the reset time when a response reports the quota running low"""
+        remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
+        if remaining < 10:
+            reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+            with self._rate_limit_lock:
+                self._rate_limit_reset = max(self._rate_limit_reset,
+                                             max(reset_time, time.time()) + 1)
 
     def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict:
         """Make API request with rate limit handling"""
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        with self._etag_lock:
+            etag = self._etags.get(key)
+        headers = {'If-None-Match': etag} if etag else None
+
         try:
-            response = self.session.get(url, params=params)
+            self._wait_for_rate_limit()
+            response = self.session.get(url, params=params, headers=headers)
+            self._check_rate_limit(response)
+
+            # Not modified since the last run: reuse the cached body
+            if response.status_code == 304:
+                cached = self._load_cached_body(key)
+                if cached is not None:
+                    return cached
+                # Body file lost; drop the ETag and fetch unconditionally
+                with self._etag_lock:
+                    self._etags.pop(key, None)
+                return self._make_request(url, params)
 
-            # Check rate limit
-            remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-            if remaining < 10:
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                wait_time = max(reset_time - time.time(), 0) + 1
-                print(f"Rate limit low. Waiting {wait_time:.0f} seconds...")
-                time.sleep(wait_time)
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            if response.headers.get('ETag'):
+                self._store_cached_body(key, response.headers['ETag'], data)
+            return data
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"API request failed: {e}")
+            return {}
+
+    def _graphql(self, query: str, variables: Dict) -> Dict:
+        """Run a GraphQL v4 query with rate limit handling; returns the data payload"""
+        try:
+            self._wait_for_rate_limit()
+            response = self.session.post(self.graphql_url,
+                                         json={'query': query, 'variables': variables})
+            self._check_rate_limit(response)
 
             response.raise_for_status()
-            return response.json()
+            payload = _json_loads(response.content)
+            if payload.get('errors'):
+                print(f"GraphQL query failed: {payload['errors'][0].get('message', '')}")
+            return payload.get('data') or {}
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"API request failed: {e}")
             return {}
 
@@ -91,9 +219,20 @@ class GitHubDataFetcher:
         url = f"{self.base_url}/repos/{self.org_name}/{repo_name}/languages"
         return self._make_request(url)
 
-    def get_commits(self, repo_name: str, since_days: int = 90) -> List[Dict]:
-        """Fetch recent commits"""
-        since_date = (datetime.now() - timedelta(days=since_days)).isoformat()
+    @staticmethod
+    def since_timestamp(since_days: int = 90) -> str:
+        """UTC midnight since_days ago, as the ISO 8601 'since' for commit queries
+
+        Day-aligned so repeat runs on the same day send identical requests and
+        reuse their cached ETags.
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=since_days)
+        return since.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+
+    def get_commits(self, repo_name: str, since_days: int = 90,
+                    since: Optional[str] = None) -> List[Dict]:
+        """Fetch recent commits (since, when given, overrides since_days)"""
+        since_date = since or self.since_timestamp(since_days)
         url = f"{self.base_url}/repos/{self.org_name}/{repo_name}/commits"
 
         commits = []
@@ -117,6 +256,45 @@ class GitHubDataFetcher:
 
         return commits
 
+    def get_commit_counts(self, repo_names: List[str], since_days: int = 90,
+                          since: Optional[str] = None) -> Dict[str, int]:
+        """Count recent default-branch commits for many repositories via GraphQL
+
+        Up to GRAPHQL_BATCH_SIZE repositories are aliased into each query, so the
+        whole organization costs a handful of requests instead of paginating
+        every repository's commit list. GraphQL requires authentication; without
+        a token, or for repositories missing from the response, no count is
+        returned and callers fall back to the REST commit listing.
+        """
+        if not self.token:
+            return {}
+
+        since_date = since or self.since_timestamp(since_days)
+        counts = {}
+
+        for start in range(0, len(repo_names), self.GRAPHQL_BATCH_SIZE):
+            batch = repo_names[start:start + self.GRAPHQL_BATCH_SIZE]
+            params = ''.join(f', $name{i}: String!' for i in range(len(batch)))
+            fields = ''.join(
+                f' repo{i}: repository(owner: $org, name: $name{i}) {{'
+                ' defaultBranchRef { target { ... on Commit { history(since: $since) { totalCount } } } } }'
+                for i in range(len(batch))
+            )
+            query = f'query($org: String!, $since: GitTimestamp!{params}) {{{fields} }}'
+            variables = {'org': self.org_name, 'since': since_date}
+            variables.update({f'name{i}': name for i, name in enumerate(batch)})
+
+            data = self._graphql(query, variables)
+            for i, name in enumerate(batch):
+                if f'repo{i}' not in data or data[f'repo{i}'] is None:
+                    continue
+                # Empty repositories have no default branch, hence no commits
+                branch = data[f'repo{i}'].get('defaultBranchRef') or {}
+                history = (branch.get('target') or {}).get('history') or {}
+                counts[name] = history.get('totalCount', 0)
+
+        return counts
+
     def get_contributors(self, repo_name: str) -> List[Dict]:
         """Fetch repository contributors"""
         url = f"{self.base_url}/repos/{self.org_name}/{repo_name}/contributors"
@@ -200,6 +378,69 @@ class GitHubDataFetcher:
         else:
             return 'Concept'
 
+    def _process_repo(self, repo: Dict, commit_counts: Optional[Dict[str, int]] = None,
+                      since: Optional[str] = None) -> Dict:
+        """Collect details, languages, commits, contributors and maturity for one repository"""
+        repo_name = repo['name']
+        print(f"Processing {repo_name}...")
+
+        # Root listing, fetched once and reused for the README/CI/tests checks
+        root_contents = self.get_repository_content(repo_name)
+
+        # Basic info
+        repo_details = {
+            'name': repo_name,
+            'full_name': repo['full_name'],
+            'description': repo.get('description', ''),
+            'url': repo['html_url'],
+            'created_at': repo['created_at'],
+            'updated_at': repo['updated_at'],
+            'pushed_at': repo.get('pushed_at', ''),
+            'stars': repo['stargazers_count'],
+            'forks': repo['forks_count'],
+            'watchers': repo['watchers_count'],
+            'open_issues': repo['open_issues_count'],
+            'default_branch': repo['default_branch'],
+            'has_readme': any(f['name'].upper().startswith('README') for f in root_contents),
+            'has_license': repo.get('license') is not None
+        }
+
+        # Languages
+        languages = self.get_repository_languages(repo_name)
+        repo_details['languages'] = languages
+
+        # Commits: the count comes from the batched GraphQL query when available;
+        # full payloads are only paginated over REST when requested or as fallback
+        commit_count = (commit_counts or {}).get(repo_name)
+        if commit_count is None or self.include_commit_details:
+            commits = self.get_commits(repo_name, since_days=90, since=since)
+            if commit_count is None:
+                commit_count = len(commits)
+            if self.include_commit_details:
+                repo_details['recent_commits'] = commits
+        repo_details['commit_count'] = commit_count
+
+        # Contributors
+        contributors = self.get_contributors(repo_name)
+        repo_details['contributor_count'] = len(contributors)
+        repo_details['contributors'] = contributors
+
+        # Check for CI/CD
+        repo_details['has_ci'] = any(
+            item['name'] == '.github' for item in root_contents
+        )
+
+        # Check for tests
+        repo_details['has_tests'] = any(
+            'test' in item['name'].lower() for item in root_contents
+        )
+
+        # Calculate maturity
+        maturity = self.analyze_repository_maturity(repo_name, repo_details)
+        repo_details['maturity'] = maturity
+
+        return repo_details
+
     def fetch_all_data(self) -> Dict:
         """Fetch comprehensive organization and repository data"""
         print(f"Fetching data for {self.org_name}...")
@@ -212,60 +453,18 @@ class GitHubDataFetcher:
         repos = self.get_repositories()
         print(f"Found {len(repos)} repositories")
 
-        repository_data = []
-
-        for repo in repos:
-            repo_name = repo['name']
-            print(f"Processing {repo_name}...")
-
-            # Basic info
-            repo_details = {
-                'name': repo_name,
-                'full_name': repo['full_name'],
-                'description': repo.get('description', ''),
-                'url': repo['html_url'],
-                'created_at': repo['created_at'],
-                'updated_at': repo['updated_at'],
-                'pushed_at': repo.get('pushed_at', ''),
-                'stars': repo['stargazers_count'],
-                'forks': repo['forks_count'],
-                'watchers': repo['watchers_count'],
-                'open_issues': repo['open_issues_count'],
-                'default_branch': repo['default_branch'],
-                'has_readme': 'README' in [f['name'].upper() for f in self.get_repository_content(repo_name)],
-                'has_license': repo.get('license') is not None
-            }
-
-            # Languages
-            languages = self.get_repository_languages(repo_name)
-            repo_details['languages'] = languages
+        # Recent commit counts for every repository in a few batched queries. The
+        # REST fallback gets the same window, so counts and commit lists agree
+        since = self.since_timestamp(90)
+        commit_counts = self.get_commit_counts([repo['name'] for repo in repos], since=since)
 
-            # Commits
-            commits = self.get_commits(repo_name, since_days=90)
-            repo_details['commit_count'] = len(commits)
-            repo_details['recent_commits'] = commits
+        # Repositories are I/O-bound on API round trips, so process them concurrently;
+        # map() keeps the results in the original repository order
+        process_repo = partial(self._process_repo, commit_counts=commit_counts, since=since)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            repository_data = list(executor.map(process_repo, repos))
 
-            # Contributors
-            contributors = self.get_contributors(repo_name)
-            repo_details['contributor_count'] = len(contributors)
-            repo_details['contributors'] = contributors
-
-            # Check for CI/CD
-            contents = self.get_repository_content(repo_name)
-            repo_details['has_ci'] = any(
-                item['name'] == '.github' for item in contents
-            )
-
-            # Check for tests
-            repo_details['has_tests'] = any(
-                'test' in item['name'].lower() for item in contents
-            )
-
-            # Calculate maturity
-            maturity = self.analyze_repository_maturity(repo_name, repo_details)
-            repo_details['maturity'] = maturity
-
-            repository_data.append(repo_details)
+        self.save_etag_cache()
 
         # Aggregate statistics
         total_commits = sum(r['commit_count'] for r in repository_data)
@@ -294,8 +493,13 @@ class GitHubDataFetcher:
     def save_data(self, data: Dict, filepath: str):
         """Save fetched data to JSON file"""
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if HAS_ORJSON:
+            # Same 2-space layout as json.dump, serialized in C straight to UTF-8 bytes
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"Data saved to {filepath}")
 
 
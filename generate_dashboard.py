@@ -5,13 +5,15 @@ Uses Jinja2 templating with templates/dashboard.html.j2
 """
 
 import os
+import re
 import json
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Dict, List
 
 try:
-    from jinja2 import Environment, FileSystemLoader
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
     HAS_JINJA2 = True
 except ImportError:
     HAS_JINJA2 = False
@@ -20,50 +22,70 @@ except ImportError:
 import yaml
 
 
+_LESSON_DIR_RE = re.compile(r'L[0-9][0-9]_')
+_CHART_DIR_RE = re.compile(r'[0-9][0-9]_')
+
+
+def _iter_subdirs(path: str, pattern: re.Pattern) -> List[os.DirEntry]:
+    """Subdirectories of path whose names match pattern, sorted by name.
+
+    One scandir per directory: DirEntry.is_dir() reuses the directory listing,
+    so no per-entry stat is needed.
+    """
+    with os.scandir(path) as it:
+        entries = [e for e in it if pattern.match(e.name) and e.is_dir()]
+    return sorted(entries, key=lambda e: e.name)
+
+
+def _scan_lesson(base_dir: str, lesson_entry: os.DirEntry) -> Dict:
+    """Build the lesson record for one L##_* directory, including its charts"""
+    lesson_dir = lesson_entry.path
+    dirname = lesson_entry.name
+    # Extract lesson number and name
+    parts = dirname.split("_", 1)
+    lesson_num = parts[0]  # e.g., "L01"
+    lesson_name = parts[1].replace("_", " ") if len(parts) > 1 else ""
+
+    # Check if .tex file exists (indicates active lesson)
+    has_tex = os.path.isfile(os.path.join(lesson_dir, f"{dirname}.tex"))
+    status = "Active" if has_tex else "Planned"
+
+    # Find chart subdirectories; one listing per chart covers both file checks
+    charts = []
+    for chart_entry in _iter_subdirs(lesson_dir, _CHART_DIR_RE):
+        chart_name = chart_entry.name
+        with os.scandir(chart_entry.path) as it:
+            files = {e.name for e in it if e.name in ("chart.py", "chart.pdf")}
+        charts.append({
+            'name': chart_name,
+            'display_name': chart_name.split("_", 1)[1].replace("_", " ").title() if "_" in chart_name else chart_name,
+            'has_py': "chart.py" in files,
+            'has_pdf': "chart.pdf" in files,
+            'path': os.path.relpath(chart_entry.path, base_dir).replace("\\", "/")
+        })
+
+    return {
+        'id': lesson_num,
+        'num': lesson_num[1:],  # "01", "02", etc.
+        'directory': dirname,
+        'title': lesson_name.title(),
+        'status': status,
+        'charts': charts,
+        'chart_count': len(charts)
+    }
+
+
 def discover_lessons(base_dir: str = ".") -> List[Dict]:
     """Scan filesystem for lesson directories and their charts"""
-    lessons = []
-
     # Find all L##_* directories
-    lesson_dirs = sorted(glob.glob(os.path.join(base_dir, "L[0-9][0-9]_*")))
-
-    for lesson_dir in lesson_dirs:
-        dirname = os.path.basename(lesson_dir)
-        # Extract lesson number and name
-        parts = dirname.split("_", 1)
-        lesson_num = parts[0]  # e.g., "L01"
-        lesson_name = parts[1].replace("_", " ") if len(parts) > 1 else ""
-
-        # Check if .tex file exists (indicates active lesson)
-        tex_files = glob.glob(os.path.join(lesson_dir, f"{dirname}.tex"))
-        status = "Active" if tex_files else "Planned"
-
-        # Find chart subdirectories
-        chart_dirs = sorted(glob.glob(os.path.join(lesson_dir, "[0-9][0-9]_*")))
-        charts = []
-        for chart_dir in chart_dirs:
-            chart_name = os.path.basename(chart_dir)
-            chart_py = os.path.join(chart_dir, "chart.py")
-            chart_pdf = os.path.join(chart_dir, "chart.pdf")
-            charts.append({
-                'name': chart_name,
-                'display_name': chart_name.split("_", 1)[1].replace("_", " ").title() if "_" in chart_name else chart_name,
-                'has_py': os.path.exists(chart_py),
-                'has_pdf': os.path.exists(chart_pdf),
-                'path': os.path.relpath(chart_dir, base_dir).replace("\\", "/")
-            })
-
-        lessons.append({
-            'id': lesson_num,
-            'num': lesson_num[1:],  # "01", "02", etc.
-            'directory': dirname,
-            'title': lesson_name.title(),
-            'status': status,
-            'charts': charts,
-            'chart_count': len(charts)
-        })
+    lesson_entries = _iter_subdirs(base_dir, _LESSON_DIR_RE)
+    if not lesson_entries:
+        return []
 
-    return lessons
+    # The scandir calls release the GIL, so lessons are scanned side by side;
+    # map() keeps the results in the sorted directory order
+    with ThreadPoolExecutor(max_workers=min(16, len(lesson_entries))) as ex:
+        return list(ex.map(partial(_scan_lesson, base_dir), lesson_entries))
 
 
 def assign_parts(lessons: List[Dict]) -> Dict[str, List[Dict]]:
@@ -86,14 +108,31 @@ def assign_parts(lessons: List[Dict]) -> Dict[str, List[Dict]]:
     return parts
 
 
+@lru_cache(maxsize=None)
+def _get_env(base_dir: str) -> "Environment":
+    """Jinja2 environment for base_dir/templates, built once per process.
+
+    Compiled templates are kept in memory by the environment and on disk in
+    .cache/jinja, so warm rebuilds skip lexing, parsing and code generation.
+    """
+    cache_dir = os.path.join(base_dir, ".cache", "jinja")
+    os.makedirs(cache_dir, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(os.path.join(base_dir, "templates")),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(cache_dir)
+    )
+
+
 def generate_dashboard(base_dir: str = "."):
     """Main dashboard generation"""
-    # Load config
+    # Load config; the literal paths below are opened directly rather than
+    # stat'ed first, so a present file costs one syscall instead of two
     config_path = os.path.join(base_dir, "config.yml")
-    if os.path.exists(config_path):
+    try:
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
-    else:
+    except FileNotFoundError:
         config = {
             'course': {
                 'title': 'Digital Finance & Economics',
@@ -112,9 +151,11 @@ def generate_dashboard(base_dir: str = "."):
     # Load repo stats if available
     stats_path = os.path.join(base_dir, "data", "repository_stats.json")
     repo_stats = {}
-    if os.path.exists(stats_path):
+    try:
         with open(stats_path, 'r') as f:
             repo_stats = json.load(f)
+    except FileNotFoundError:
+        pass
 
     # Compute aggregate stats
     total_charts = sum(l['chart_count'] for l in lessons)
@@ -132,8 +173,7 @@ def generate_dashboard(base_dir: str = "."):
     output_path = os.path.join(base_dir, "index.html")
 
     if HAS_JINJA2 and os.path.exists(template_path):
-        env = Environment(loader=FileSystemLoader(os.path.join(base_dir, "templates")))
-        template = env.get_template("dashboard.html.j2")
+        template = _get_env(base_dir).get_template("dashboard.html.j2")
 
         html = template.render(
             config=config,
@@ -5,8 +5,28 @@ Adds 'detailed' and 'example' fields from fragments to existing terms.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads(raw: bytes):
+    """Decode JSON bytes (orjson when available)"""
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def _dumps(obj) -> bytes:
+    """Encode as 2-space indented UTF-8 JSON, same layout as json.dump(indent=2, ensure_ascii=False)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
 def main():
     # Define paths
     base_dir = Path(__file__).parent
@@ -29,12 +49,16 @@ def main():
     print("Reading fragment files...")
     fragment_data = {}
 
-    for fname in fragment_files:
-        fpath = fragments_dir / fname
-        print(f"  - {fname}")
+    def read_fragment(fname):
+        return _loads((fragments_dir / fname).read_bytes())
 
-        with open(fpath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    # Files are read concurrently; map() yields them in fragment_files order,
+    # so validation and duplicate-ID detection stay deterministic
+    with ThreadPoolExecutor(max_workers=len(fragment_files)) as ex:
+        fragments = list(ex.map(read_fragment, fragment_files))
+
+    for fname, data in zip(fragment_files, fragments):
+        print(f"  - {fname}")
 
         # Validate: must be array of objects with id, detailed, example
         if not isinstance(data, list):
@@ -61,26 +85,35 @@ def main():
 
     # Step 2: Read master glossary
     print(f"\nReading master glossary: {master_file}")
-    with open(master_file, 'r', encoding='utf-8') as f:
-        master = json.load(f)
+    with open(master_file, 'rb') as f:
+        master = _loads(f.read())
 
     original_count = len(master['terms'])
     print(f"Master glossary has {original_count} terms")
 
-    # Step 3: Merge fragments into master
+    # Step 3: Merge fragments into master and validate every term in one pass
     print("\nMerging fragments into master...")
     merged_count = 0
     missing_ids = []
+    validation_errors = []
+    total_fragments = len(fragment_data)
 
-    for term in master['terms']:
+    # Used fragments are popped, so whatever is left afterwards is the extras
+    for i, term in enumerate(master['terms']):
         term_id = term['id']
-        if term_id in fragment_data:
-            term['detailed'] = fragment_data[term_id]['detailed']
-            term['example'] = fragment_data[term_id]['example']
+        fragment = fragment_data.pop(term_id, None)
+        if fragment is not None:
+            term['detailed'] = fragment['detailed']
+            term['example'] = fragment['example']
             merged_count += 1
         else:
             missing_ids.append(term_id)
 
+        # Step 4 (inline): the term must now have detailed and example
+        for field in ['detailed', 'example']:
+            if field not in term or not term[field]:
+                validation_errors.append(f"Term {i} ('{term_id}'): missing '{field}'")
+
     print(f"Merged {merged_count} terms")
 
     if missing_ids:
@@ -91,8 +124,7 @@ def main():
             print(f"  ... and {len(missing_ids) - 10} more")
 
     # Check for extra fragment IDs not in master
-    master_ids = {term['id'] for term in master['terms']}
-    extra_ids = set(fragment_data.keys()) - master_ids
+    extra_ids = fragment_data.keys()
     if extra_ids:
         print(f"\nWARNING: {len(extra_ids)} fragment IDs not in master:")
         for eid in sorted(extra_ids)[:10]:
@@ -100,14 +132,7 @@ def main():
         if len(extra_ids) > 10:
             print(f"  ... and {len(extra_ids) - 10} more")
 
-    # Step 4: Validate all terms now have detailed and example
     print("\nValidating merged data...")
-    validation_errors = []
-    for i, term in enumerate(master['terms']):
-        for field in ['detailed', 'example']:
-            if field not in term or not term[field]:
-                validation_errors.append(f"Term {i} ('{term.get('id', 'NO-ID')}'): missing '{field}'")
-
     if validation_errors:
         print(f"ERROR: {len(validation_errors)} validation failures:")
         for err in validation_errors[:20]:
@@ -124,13 +149,13 @@ def main():
 
     # Step 6: Write merged file
     print(f"\nWriting merged glossary to {master_file}")
-    with open(master_file, 'w', encoding='utf-8') as f:
-        json.dump(master, f, ensure_ascii=False, indent=2)
+    with open(master_file, 'wb') as f:
+        f.write(_dumps(master))
 
     print(f"\nSUCCESS!")
     print(f"  Total terms: {len(master['terms'])}")
     print(f"  Terms merged: {merged_count}")
-    print(f"  Fragment entries used: {merged_count}/{len(fragment_data)}")
+    print(f"  Fragment entries used: {merged_count}/{total_fragments}")
 
     return 0
 
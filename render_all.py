@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Render chart scripts concurrently, one interpreter per CPU core.
+
+Each script is run as ``python script.py`` in its own subprocess, so the
+CPU-bound matplotlib renders proceed in parallel rather than one after
+another, and no rcParams or module state leaks from one script into the next.
+A small thread pool only launches the subprocesses and waits on them.
+
+Usage:
+    python render_all.py
+    python render_all.py --workers 2
+"""
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+
+CHART_SCRIPTS = [
+    BASE_DIR / 'assignments' / 'l01-presentation' / 'chart_varied.py',
+    BASE_DIR / 'assignments' / 'l02-presentation' / 'chart_varied.py',
+    BASE_DIR / 'assignments' / 'l03-presentation' / 'chart_varied.py',
+    BASE_DIR / 'assignments' / 'l04-presentation' / 'chart_varied.py',
+    BASE_DIR / 'assignments' / 'l05-presentation' / 'chart_varied.py',
+    BASE_DIR / 'assignments' / 'l06-presentation' / 'chart_varied.py',
+    BASE_DIR / 'L08_Synthesis' / '09_policy_effectiveness_enhanced' / 'chart.py',
+    BASE_DIR / 'L08_Synthesis' / '10_trilemma_technology_frontier' / 'chart.py',
+    BASE_DIR / 'L08_Synthesis' / '11_cross_lens_interaction_matrix' / 'chart.py',
+]
+
+
+def render(script: Path) -> str:
+    """Run one chart script in a fresh interpreter; raise with its stderr on failure"""
+    proc = subprocess.run([sys.executable, str(script)], capture_output=True, text=True)
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit status {proc.returncode}")
+    return str(script.relative_to(BASE_DIR))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render chart scripts in parallel")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    workers = max(1, min(args.workers or 1, len(CHART_SCRIPTS)))
+    print(f"Rendering {len(CHART_SCRIPTS)} charts with {workers} workers...\n")
+
+    failures = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(render, script): script for script in CHART_SCRIPTS}
+        for future in as_completed(futures):
+            script = futures[future]
+            try:
+                print(f"[OK] {future.result()}")
+            except Exception as e:
+                failures.append(script)
+                print(f"[FAIL] {script.relative_to(BASE_DIR)}: {e}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
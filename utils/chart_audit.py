@@ -1,12 +1,159 @@
 #!/usr/bin/env python3
 """Chart Quality Audit Tool - Analyzes chart.py files against 20 criteria."""
 
+import argparse
 import ast
+import os
 import re
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+ML_COLORS = ['MLPURPLE', 'MLBLUE', 'MLORANGE', 'MLGREEN', 'MLRED']
+RC_KEYS = ('font.size', 'axes.labelsize', 'xtick.labelsize', 'ytick.labelsize',
+           'legend.fontsize', 'figure.figsize')
+
+# Text patterns, compiled once per process (and once per audit worker)
+_RE_UNITS = re.compile(r'[\(%$€£¥]|\bper\b|\b/\b|years?|months?|days?|seconds?|%', re.I)
+_RE_THEORY = re.compile(r'[A-Z][a-z]+(?:\s+(?:et\s+al\.?|and\s+[A-Z][a-z]+))?\s*\(\d{4}\)')
+# Matched against the raw file bytes, so the LaTeX check needs no decode of the source
+_RE_LATEX = re.compile(r"r?['\"]?\$[^$]+\$|\\\\frac|\\\\sum|\\\\int|\\\\sigma|\\\\alpha|\\\\beta|\\\\cdot|cdot|\\\\Delta|\\\\omega|\\\\pi|≤|≥|→|×|÷|²|³".encode('utf-8'))
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get plain dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass
+class ChartFacts:
+    """Everything the criteria need from one chart.py, collected in a single AST pass."""
+    rc: Dict[str, Any] = field(default_factory=dict)
+    figsize: Optional[Tuple[float, float]] = None
+    savefig_dpi: Dict[str, int] = field(default_factory=dict)
+    dpi_values: List[int] = field(default_factory=list)
+    first_string_arg: Dict[str, str] = field(default_factory=dict)
+    call_counts: Dict[str, int] = field(default_factory=dict)
+    ax_text_count: int = 0
+    has_grid: bool = False
+    names: set = field(default_factory=set)
+    uses_path_file: bool = False
+
+
+@dataclass(**_SLOTS)
+class Crit:
+    """Outcome of one criterion for one chart; becomes a dict only in the JSON report."""
+    passed: bool
+    value: Any
+    threshold: str
+
+
+def _json_default(obj: Any) -> Dict[str, Any]:
+    """json/orjson default hook: write each Crit in the report's pass/value/threshold shape."""
+    if isinstance(obj, Crit):
+        return {'pass': obj.passed, 'value': obj.value, 'threshold': obj.threshold}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _number(node: ast.AST) -> Optional[float]:
+    """Value of a numeric literal, else None"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+            and not isinstance(node.value, bool):
+        return node.value
+    return None
+
+
+def _pair(node: ast.AST) -> Optional[Tuple[float, float]]:
+    """(w, h) of a two-number tuple literal, else None"""
+    if isinstance(node, ast.Tuple) and len(node.elts) == 2:
+        w, h = _number(node.elts[0]), _number(node.elts[1])
+        if w is not None and h is not None:
+            return float(w), float(h)
+    return None
+
+
+def _string_parts(node: ast.AST) -> str:
+    """All string literals inside an expression, concatenated (covers Path / 'x.png', f-strings)"""
+    return ''.join(n.value for n in ast.walk(node)
+                   if isinstance(n, ast.Constant) and isinstance(n.value, str))
+
+
+class _FactCollector(ast.NodeVisitor):
+    """Walks the tree in source order and fills a ChartFacts."""
+
+    def __init__(self):
+        self.facts = ChartFacts()
+        self._rc_figsize = None
+
+    def visit_Dict(self, node: ast.Dict):
+        # rcParams-style literals: keep the first literal value seen for each key
+        for key, value in zip(node.keys, node.values):
+            if isinstance(key, ast.Constant) and key.value in RC_KEYS and key.value not in self.facts.rc:
+                literal = _pair(value) if key.value == 'figure.figsize' else _number(value)
+                if literal is not None:
+                    self.facts.rc[key.value] = literal
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        facts = self.facts
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        facts.call_counts[name] = facts.call_counts.get(name, 0) + 1
+
+        for kw in node.keywords:
+            if kw.arg == 'figsize' and facts.figsize is None:
+                facts.figsize = _pair(kw.value)
+            elif kw.arg == 'dpi' and _number(kw.value) is not None:
+                facts.dpi_values.append(int(kw.value.value))
+
+        if name == 'savefig' and node.args:
+            target = _string_parts(node.args[0])
+            dpi = next((int(kw.value.value) for kw in node.keywords
+                        if kw.arg == 'dpi' and _number(kw.value) is not None), None)
+            for ext in ('png', 'pdf'):
+                if f'.{ext}' in target and dpi is not None:
+                    facts.savefig_dpi.setdefault(ext, dpi)
+        elif name in ('set_xlabel', 'set_ylabel', 'set_title') and name not in facts.first_string_arg:
+            # Literal text of the label, including 'a' + 'b' concatenations
+            text = _string_parts(node.args[0]) if node.args else ''
+            if text:
+                facts.first_string_arg[name] = text
+        elif name == 'text' and isinstance(func, ast.Attribute) \
+                and isinstance(func.value, ast.Name) and func.value.id == 'ax':
+            facts.ax_text_count += 1
+        elif name == 'grid':
+            # grid(True, ...) or grid(alpha=...) turns the grid on
+            if (node.args and isinstance(node.args[0], ast.Constant) and node.args[0].value is True) \
+                    or (not node.args and node.keywords and node.keywords[0].arg == 'alpha'):
+                facts.has_grid = True
+        elif name == 'Path' and any(isinstance(a, ast.Name) and a.id == '__file__' for a in node.args):
+            facts.uses_path_file = True
+
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name):
+        self.facts.names.add(node.id)
+
+    def visit_alias(self, node: ast.alias):
+        self.facts.names.add(node.asname or node.name)
+
+
+def collect_facts(tree: ast.AST) -> ChartFacts:
+    """Collect the audit facts of a parsed chart in one traversal."""
+    collector = _FactCollector()
+    collector.visit(tree)
+    facts = collector.facts
+    if facts.figsize is None:
+        facts.figsize = facts.rc.get('figure.figsize')
+    return facts
+
 
 def analyze_chart(chart_path: Path) -> Dict[str, Any]:
     """Analyze a single chart.py against all 20 criteria."""
@@ -17,9 +164,10 @@ def analyze_chart(chart_path: Path) -> Dict[str, Any]:
         'fail_count': 0
     }
 
-    # Read source code
+    # Read source code as bytes: ast.parse decodes it itself (honouring any
+    # coding cookie) and the LaTeX pattern is a bytes regex
     try:
-        source = chart_path.read_text(encoding='utf-8')
+        source = chart_path.read_bytes()
     except Exception as e:
         results['error'] = str(e)
         return results
@@ -31,206 +179,193 @@ def analyze_chart(chart_path: Path) -> Dict[str, Any]:
         results['error'] = f"Syntax error: {e}"
         return results
 
-    # Extract docstring
+    # Extract docstring and every structural fact in one traversal
     docstring = ast.get_docstring(tree) or ""
+    facts = collect_facts(tree)
 
     # A1: Font size >= 12
-    font_match = re.search(r"'font\.size':\s*(\d+)", source)
-    font_size = int(font_match.group(1)) if font_match else 0
-    results['criteria']['A1_font_size'] = {
-        'pass': font_size >= 12,
-        'value': font_size,
-        'threshold': '>= 12'
-    }
+    font_size = int(facts.rc.get('font.size', 0))
+    results['criteria']['A1_font_size'] = Crit(
+        passed=font_size >= 12,
+        value=font_size,
+        threshold='>= 12'
+    )
 
     # A2: Axis label size >= 11
-    label_match = re.search(r"'axes\.labelsize':\s*(\d+)", source)
-    label_size = int(label_match.group(1)) if label_match else 0
-    results['criteria']['A2_axis_label_size'] = {
-        'pass': label_size >= 11,
-        'value': label_size,
-        'threshold': '>= 11'
-    }
+    label_size = int(facts.rc.get('axes.labelsize', 0))
+    results['criteria']['A2_axis_label_size'] = Crit(
+        passed=label_size >= 11,
+        value=label_size,
+        threshold='>= 11'
+    )
 
     # A3: Figure size adequate
-    # Check for figsize in plt.subplots(), plt.figure(), AND rcParams
-    figsize_match = re.search(r'figsize\s*=\s*\((\d+(?:\.\d+)?),\s*(\d+(?:\.\d+)?)\)', source)
-    if not figsize_match:
-        # Also check rcParams pattern: 'figure.figsize': (10, 6)
-        figsize_match = re.search(r"'figure\.figsize'\s*:\s*\((\d+(?:\.\d+)?),\s*(\d+(?:\.\d+)?)\)", source)
-    if figsize_match:
-        width, height = float(figsize_match.group(1)), float(figsize_match.group(2))
+    # figsize= in plt.subplots()/plt.figure(), else rcParams 'figure.figsize'
+    if facts.figsize:
+        width, height = facts.figsize
         adequate = width >= 10 or height >= 6
     else:
         width, height, adequate = 0, 0, False
-    results['criteria']['A3_figure_size'] = {
-        'pass': adequate,
-        'value': f'{width}x{height}',
-        'threshold': 'width >= 10 OR height >= 6'
-    }
+    results['criteria']['A3_figure_size'] = Crit(
+        passed=adequate,
+        value=f'{width}x{height}',
+        threshold='width >= 10 OR height >= 6'
+    )
 
     # A4: DPI quality
-    png_dpi_match = re.search(r"savefig.*?\.png.*?dpi\s*=\s*(\d+)", source, re.DOTALL)
-    pdf_dpi_match = re.search(r"savefig.*?\.pdf.*?dpi\s*=\s*(\d+)", source, re.DOTALL)
-    # Also check for dpi in any savefig
-    any_dpi = re.findall(r'dpi\s*=\s*(\d+)', source)
-    png_dpi = int(png_dpi_match.group(1)) if png_dpi_match else (int(any_dpi[1]) if len(any_dpi) > 1 else 150)
-    pdf_dpi = int(pdf_dpi_match.group(1)) if pdf_dpi_match else (int(any_dpi[0]) if any_dpi else 300)
-    results['criteria']['A4_dpi_quality'] = {
-        'pass': png_dpi >= 150 and pdf_dpi >= 300,
-        'value': f'PNG:{png_dpi}, PDF:{pdf_dpi}',
-        'threshold': 'PNG >= 150, PDF >= 300'
-    }
+    # Also check for dpi= in any call
+    any_dpi = facts.dpi_values
+    png_dpi = facts.savefig_dpi.get('png', any_dpi[1] if len(any_dpi) > 1 else 150)
+    pdf_dpi = facts.savefig_dpi.get('pdf', any_dpi[0] if any_dpi else 300)
+    results['criteria']['A4_dpi_quality'] = Crit(
+        passed=png_dpi >= 150 and pdf_dpi >= 300,
+        value=f'PNG:{png_dpi}, PDF:{pdf_dpi}',
+        threshold='PNG >= 150, PDF >= 300'
+    )
 
     # A5: Tick label size >= 10
-    xtick_match = re.search(r"'xtick\.labelsize':\s*(\d+)", source)
-    ytick_match = re.search(r"'ytick\.labelsize':\s*(\d+)", source)
-    xtick_size = int(xtick_match.group(1)) if xtick_match else 0
-    ytick_size = int(ytick_match.group(1)) if ytick_match else 0
-    results['criteria']['A5_tick_label_size'] = {
-        'pass': xtick_size >= 10 and ytick_size >= 10,
-        'value': f'X:{xtick_size}, Y:{ytick_size}',
-        'threshold': 'both >= 10'
-    }
+    xtick_size = int(facts.rc.get('xtick.labelsize', 0))
+    ytick_size = int(facts.rc.get('ytick.labelsize', 0))
+    results['criteria']['A5_tick_label_size'] = Crit(
+        passed=xtick_size >= 10 and ytick_size >= 10,
+        value=f'X:{xtick_size}, Y:{ytick_size}',
+        threshold='both >= 10'
+    )
 
     # A6: Legend font size >= 10
-    legend_match = re.search(r"'legend\.fontsize':\s*(\d+)", source)
-    legend_size = int(legend_match.group(1)) if legend_match else 0
-    results['criteria']['A6_legend_font_size'] = {
-        'pass': legend_size >= 10,
-        'value': legend_size,
-        'threshold': '>= 10'
-    }
+    legend_size = int(facts.rc.get('legend.fontsize', 0))
+    results['criteria']['A6_legend_font_size'] = Crit(
+        passed=legend_size >= 10,
+        value=legend_size,
+        threshold='>= 10'
+    )
 
     # A7: Uses standard ML color palette
-    ml_colors = ['MLPURPLE', 'MLBLUE', 'MLORANGE', 'MLGREEN', 'MLRED']
-    colors_defined = sum(1 for c in ml_colors if c in source)
-    results['criteria']['A7_color_palette'] = {
-        'pass': colors_defined >= 3,  # At least 3 of 5 colors used
-        'value': f'{colors_defined}/5 ML colors',
-        'threshold': '>= 3 ML colors defined'
-    }
+    colors_defined = sum(1 for c in ML_COLORS if c in facts.names)
+    results['criteria']['A7_color_palette'] = Crit(
+        passed=colors_defined >= 3,  # At least 3 of 5 colors used
+        value=f'{colors_defined}/5 ML colors',
+        threshold='>= 3 ML colors defined'
+    )
 
     # B1: Axis labels present
-    has_xlabel = 'set_xlabel' in source
-    has_ylabel = 'set_ylabel' in source
-    results['criteria']['B1_axis_labels'] = {
-        'pass': has_xlabel and has_ylabel,
-        'value': f'X:{has_xlabel}, Y:{has_ylabel}',
-        'threshold': 'both present'
-    }
+    has_xlabel = 'set_xlabel' in facts.call_counts
+    has_ylabel = 'set_ylabel' in facts.call_counts
+    results['criteria']['B1_axis_labels'] = Crit(
+        passed=has_xlabel and has_ylabel,
+        value=f'X:{has_xlabel}, Y:{has_ylabel}',
+        threshold='both present'
+    )
 
     # B2: Title descriptive (5+ words)
-    title_match = re.search(r"set_title\s*\(\s*['\"](.+?)['\"]", source)
-    title_text = title_match.group(1) if title_match else ""
+    title_text = facts.first_string_arg.get('set_title', "")
     title_words = len(title_text.split()) if title_text else 0
-    results['criteria']['B2_title_descriptive'] = {
-        'pass': title_words >= 5,
-        'value': f'{title_words} words',
-        'threshold': '>= 5 words'
-    }
+    results['criteria']['B2_title_descriptive'] = Crit(
+        passed=title_words >= 5,
+        value=f'{title_words} words',
+        threshold='>= 5 words'
+    )
 
     # B3: Legend clarity
-    plot_count = len(re.findall(r'\.plot\(', source))
-    has_legend = 'legend(' in source
+    plot_count = facts.call_counts.get('plot', 0)
+    has_legend = 'legend' in facts.call_counts
     needs_legend = plot_count >= 2
-    results['criteria']['B3_legend_clarity'] = {
-        'pass': not needs_legend or has_legend,
-        'value': f'{plot_count} plots, legend:{has_legend}',
-        'threshold': 'legend if 2+ plots'
-    }
+    results['criteria']['B3_legend_clarity'] = Crit(
+        passed=not needs_legend or has_legend,
+        value=f'{plot_count} plots, legend:{has_legend}',
+        threshold='legend if 2+ plots'
+    )
 
     # B4: Grid lines
-    has_grid = 'grid(True' in source or 'grid(alpha' in source
-    results['criteria']['B4_grid_lines'] = {
-        'pass': has_grid,
-        'value': has_grid,
-        'threshold': 'grid(True) present'
-    }
+    has_grid = facts.has_grid
+    results['criteria']['B4_grid_lines'] = Crit(
+        passed=has_grid,
+        value=has_grid,
+        threshold='grid(True) present'
+    )
 
     # B5: Has data annotations
-    annotation_count = len(re.findall(r'\.annotate\(|ax\.text\(', source))
-    results['criteria']['B5_data_annotations'] = {
-        'pass': annotation_count >= 1,
-        'value': f'{annotation_count} annotations',
-        'threshold': '>= 1 annotation'
-    }
+    annotation_count = facts.call_counts.get('annotate', 0) + facts.ax_text_count
+    results['criteria']['B5_data_annotations'] = Crit(
+        passed=annotation_count >= 1,
+        value=f'{annotation_count} annotations',
+        threshold='>= 1 annotation'
+    )
 
     # B6: Axis labels include units
-    xlabel_match = re.search(r"set_xlabel\s*\(['\"]([^'\"]+)['\"]", source)
-    ylabel_match = re.search(r"set_ylabel\s*\(['\"]([^'\"]+)['\"]", source)
-    xlabel = xlabel_match.group(1) if xlabel_match else ""
-    ylabel = ylabel_match.group(1) if ylabel_match else ""
-    unit_patterns = r'[\(%$€£¥]|\bper\b|\b/\b|years?|months?|days?|seconds?|%'
-    has_units = bool(re.search(unit_patterns, xlabel, re.I)) or bool(re.search(unit_patterns, ylabel, re.I))
-    results['criteria']['B6_units_specified'] = {
-        'pass': has_units,
-        'value': f'X:"{xlabel}", Y:"{ylabel}"',
-        'threshold': 'unit indicator in axis label'
-    }
+    xlabel = facts.first_string_arg.get('set_xlabel', "")
+    ylabel = facts.first_string_arg.get('set_ylabel', "")
+    has_units = bool(_RE_UNITS.search(xlabel)) or bool(_RE_UNITS.search(ylabel))
+    results['criteria']['B6_units_specified'] = Crit(
+        passed=has_units,
+        value=f'X:"{xlabel}", Y:"{ylabel}"',
+        threshold='unit indicator in axis label'
+    )
 
     # C1: Docstring quality
     docstring_len = len(docstring)
-    results['criteria']['C1_docstring_quality'] = {
-        'pass': docstring_len >= 50,
-        'value': f'{docstring_len} chars',
-        'threshold': '>= 50 chars'
-    }
+    results['criteria']['C1_docstring_quality'] = Crit(
+        passed=docstring_len >= 50,
+        value=f'{docstring_len} chars',
+        threshold='>= 50 chars'
+    )
 
     # C2: Theory reference (Author (Year) pattern - including "et al.")
-    theory_pattern = re.search(r'[A-Z][a-z]+(?:\s+(?:et\s+al\.?|and\s+[A-Z][a-z]+))?\s*\(\d{4}\)', docstring)
-    results['criteria']['C2_theory_reference'] = {
-        'pass': bool(theory_pattern),
-        'value': theory_pattern.group(0) if theory_pattern else 'None',
-        'threshold': 'Author (Year) format'
-    }
+    theory_pattern = _RE_THEORY.search(docstring)
+    results['criteria']['C2_theory_reference'] = Crit(
+        passed=bool(theory_pattern),
+        value=theory_pattern.group(0) if theory_pattern else 'None',
+        threshold='Author (Year) format'
+    )
 
     # C3: Theory annotation on chart
-    has_annotation = 'ax.text(' in source or 'ax.annotate(' in source or '.text(' in source
-    results['criteria']['C3_theory_annotation'] = {
-        'pass': has_annotation,
-        'value': has_annotation,
-        'threshold': 'ax.text or ax.annotate present'
-    }
+    has_annotation = 'text' in facts.call_counts or 'annotate' in facts.call_counts
+    results['criteria']['C3_theory_annotation'] = Crit(
+        passed=has_annotation,
+        value=has_annotation,
+        threshold='ax.text or ax.annotate present'
+    )
 
     # C4: Has LaTeX formula or economic model
     # Match: $...$ patterns, r'$...$' raw strings, or common LaTeX symbols
-    has_latex = bool(re.search(r"r?['\"]?\$[^$]+\$|\\\\frac|\\\\sum|\\\\int|\\\\sigma|\\\\alpha|\\\\beta|\\\\cdot|cdot|\\\\Delta|\\\\omega|\\\\pi|≤|≥|→|×|÷|²|³", source))
-    results['criteria']['C4_economic_model'] = {
-        'pass': has_latex,
-        'value': has_latex,
-        'threshold': 'LaTeX formula present'
-    }
+    has_latex = bool(_RE_LATEX.search(source))
+    results['criteria']['C4_economic_model'] = Crit(
+        passed=has_latex,
+        value=has_latex,
+        threshold='LaTeX formula present'
+    )
 
     # D1: File completeness
-    chart_dir = chart_path.parent
-    png_exists = (chart_dir / 'chart.png').exists()
-    pdf_exists = (chart_dir / 'chart.pdf').exists()
-    results['criteria']['D1_file_completeness'] = {
-        'pass': png_exists and pdf_exists,
-        'value': f'PNG:{png_exists}, PDF:{pdf_exists}',
-        'threshold': 'both files exist'
-    }
+    # One listing of the chart directory instead of a stat() per output file
+    with os.scandir(chart_path.parent) as it:
+        files = {entry.name for entry in it if entry.is_file()}
+    png_exists = 'chart.png' in files
+    pdf_exists = 'chart.pdf' in files
+    results['criteria']['D1_file_completeness'] = Crit(
+        passed=png_exists and pdf_exists,
+        value=f'PNG:{png_exists}, PDF:{pdf_exists}',
+        threshold='both files exist'
+    )
 
     # D2: Code quality (Path(__file__) usage)
-    uses_path_file = 'Path(__file__)' in source
-    results['criteria']['D2_code_quality'] = {
-        'pass': uses_path_file,
-        'value': uses_path_file,
-        'threshold': 'Path(__file__) used'
-    }
+    uses_path_file = facts.uses_path_file
+    results['criteria']['D2_code_quality'] = Crit(
+        passed=uses_path_file,
+        value=uses_path_file,
+        threshold='Path(__file__) used'
+    )
 
     # E1: Course coverage (informational - checked at lesson level)
     # This criterion is tracked at lesson level, not individual chart
-    results['criteria']['E1_coverage_info'] = {
-        'pass': True,  # Always passes at chart level
-        'value': 'See lesson summary',
-        'threshold': 'informational only'
-    }
+    results['criteria']['E1_coverage_info'] = Crit(
+        passed=True,  # Always passes at chart level
+        value='See lesson summary',
+        threshold='informational only'
+    )
 
     # Calculate totals
-    for criterion, data in results['criteria'].items():
-        if data['pass']:
+    for crit in results['criteria'].values():
+        if crit.passed:
             results['pass_count'] += 1
         else:
             results['fail_count'] += 1
@@ -238,9 +373,34 @@ def analyze_chart(chart_path: Path) -> Dict[str, Any]:
     return results
 
 
-def audit_directory(base_path: Path) -> Dict[str, Any]:
-    """Audit all chart.py files in the repository."""
-    charts = sorted(base_path.glob('L*/*/chart.py'))
+def find_charts(base_path: Path) -> List[Path]:
+    """Every ``L*/<chart>/chart.py`` under base_path, sorted.
+
+    Two fixed levels of scandir: names come back as plain strings, and a Path
+    is only built for the chart.py files that exist.
+    """
+    charts = []
+    with os.scandir(base_path) as lessons:
+        for lesson in lessons:
+            if not (lesson.name.startswith('L') and lesson.is_dir()):
+                continue
+            with os.scandir(lesson.path) as chart_dirs:
+                for chart_dir in chart_dirs:
+                    if chart_dir.is_dir():
+                        chart_file = os.path.join(chart_dir.path, 'chart.py')
+                        if os.path.isfile(chart_file):
+                            charts.append(Path(chart_file))
+    return sorted(charts)
+
+
+def audit_directory(base_path: Path, jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Audit all chart.py files in the repository.
+
+    Each chart is analyzed independently, so the charts are spread over
+    ``jobs`` worker processes (default: one per CPU); small sets run serially.
+    """
+    charts = find_charts(base_path)
+    jobs = jobs or os.cpu_count() or 1
 
     all_results = {
         'total_charts': len(charts),
@@ -267,16 +427,21 @@ def audit_directory(base_path: Path) -> Dict[str, Any]:
     for name in criteria_names:
         all_results['summary']['by_criterion'][name] = {'pass': 0, 'fail': 0}
 
-    # Analyze each chart
-    for chart_path in charts:
-        result = analyze_chart(chart_path)
+    # Analyze each chart; map() keeps the sorted chart order
+    if jobs > 1 and len(charts) >= 4:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = list(ex.map(analyze_chart, charts, chunksize=8))
+    else:
+        results = [analyze_chart(chart_path) for chart_path in charts]
+
+    for result in results:
         all_results['charts'].append(result)
 
         all_results['summary']['total_pass'] += result['pass_count']
         all_results['summary']['total_fail'] += result['fail_count']
 
-        for criterion, data in result['criteria'].items():
-            if data['pass']:
+        for criterion, crit in result['criteria'].items():
+            if crit.passed:
                 all_results['summary']['by_criterion'][criterion]['pass'] += 1
             else:
                 all_results['summary']['by_criterion'][criterion]['fail'] += 1
@@ -286,16 +451,19 @@ def audit_directory(base_path: Path) -> Dict[str, Any]:
 
 def main():
     """Main entry point."""
-    if len(sys.argv) > 1:
-        base_path = Path(sys.argv[1])
-    else:
-        base_path = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('base_path', nargs='?', type=Path, default=Path(__file__).parent.parent,
+                        help='repository root to audit (default: this repository)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='worker processes for the audit (default: CPU count; 1 = serial)')
+    args = parser.parse_args()
+    base_path = args.base_path
 
     if not base_path.exists():
         print(f"Error: Path does not exist: {base_path}", file=sys.stderr)
         sys.exit(1)
 
-    results = audit_directory(base_path)
+    results = audit_directory(base_path, jobs=args.jobs)
 
     # Print summary
     print("=" * 60)
@@ -320,16 +488,21 @@ def main():
     # Print failures
     print("FAILURES:")
     for chart in results['charts']:
-        failures = [k for k, v in chart['criteria'].items() if not v['pass']]
+        failures = [(k, v) for k, v in chart['criteria'].items() if not v.passed]
         if failures:
             print(f"  {chart['path']}")
-            for f in failures:
-                print(f"    - {f}: {chart['criteria'][f]['value']} (need {chart['criteria'][f]['threshold']})")
+            for name, crit in failures:
+                print(f"    - {name}: {crit.value} (need {crit.threshold})")
 
     # Output JSON
     json_path = base_path / '.omc' / 'reports' / 'chart-audit-results.json'
     json_path.parent.mkdir(parents=True, exist_ok=True)
-    json_path.write_text(json.dumps(results, indent=2))
+    if HAS_ORJSON:
+        json_path.write_bytes(orjson.dumps(
+            results, default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS))
+    else:
+        json_path.write_text(json.dumps(results, indent=2, default=_json_default))
     print(f"\nFull results saved to: {json_path}")
 
     # Return exit code based on failures
@@ -13,12 +13,24 @@ python check_links.py
 # Include external URL validation
 python check_links.py --check-external
 
+# Limit concurrent external requests
+python check_links.py --check-external --workers 8
+
+# Check external URLs from a thread pool even when aiohttp is installed
+python check_links.py --check-external --no-async
+
 # Check specific file
 python check_links.py --file index.html
 
 # Verbose output
 python check_links.py -v
 
+# Re-extract every file instead of using .cache/links.json
+python check_links.py --no-cache
+
+# Re-check every external URL instead of trusting ones that passed in the last 24h
+python check_links.py --check-external --no-url-cache
+
 # Custom base path
 python check_links.py --base-path /path/to/repo
 
@@ -30,28 +42,62 @@ Exit Codes:
 """
 
 import argparse
+import asyncio
+import hashlib
 import html.parser
+import io
+import itertools
+import json
 import os
 import re
 import sys
+import tempfile
+import threading
+import time
 import urllib.parse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 # Optional HTTP checking
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+# Optional async HTTP client for concurrent external checks (falls back to threads)
+try:
+    import aiohttp
+    # Failures to reach a host at all; ConnectionTimeoutError (aiohttp 3.10+) is the
+    # sock_connect timeout, older versions only raise an unspecific ServerTimeoutError
+    AIOHTTP_CONNECT_ERRORS = (aiohttp.ClientConnectorError,) + (
+        (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, 'ConnectionTimeoutError') else ())
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Optional C HTML tokenizer (falls back to html.parser)
+try:
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older interpreters get plain dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Link:
     """Represents a link found in an HTML file."""
     url: str
@@ -61,7 +107,7 @@ class Link:
     element: str    # 'a', 'img', 'link', 'script'
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CheckResult:
     """Result of checking a single link."""
     link: Link
@@ -69,7 +115,7 @@ class CheckResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Summary:
     """Summary statistics for the check run."""
     total_links: int = 0
@@ -80,6 +126,19 @@ class Summary:
     results: List[CheckResult] = field(default_factory=list)
 
 
+# Cross-run cache of external URLs that passed (see ExternalChecker)
+DEFAULT_URL_CACHE = Path.home() / '.cache' / 'linkchecker' / 'urls.json'
+
+# id attributes with double-quoted, single-quoted or unquoted values
+ID_ATTR_RE = re.compile(rb'(?<![\w-])id\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|([^\s"\'>]+))', re.IGNORECASE)
+
+# URL prefixes and CDN hosts used to classify links
+HTTP_SCHEMES = ('http://', 'https://')
+SKIP_SCHEMES = ('mailto:', 'tel:', 'javascript:')
+CDN_HOSTS = frozenset({'cdn.jsdelivr.net', 'fastly.jsdelivr.net', 'unpkg.com', 'katex.org'})
+CDN_SUFFIXES = ('.jsdelivr.net', '.unpkg.com', '.katex.org')
+
+
 # =============================================================================
 # HTML PARSER
 # =============================================================================
@@ -121,20 +180,131 @@ class LinkExtractor(html.parser.HTMLParser):
             element=element
         ))
 
-    def _classify_link(self, url: str) -> str:
+    @staticmethod
+    def _classify_link(url: str) -> str:
         """Classify link type based on URL pattern."""
         if url.startswith('#'):
             return 'fragment'
-        elif url.startswith(('http://', 'https://')):
-            if 'cdn.' in url or 'jsdelivr' in url or 'unpkg' in url or 'katex' in url:
+        elif url.startswith(HTTP_SCHEMES):
+            host = urllib.parse.urlsplit(url).hostname or ''
+            if host in CDN_HOSTS or host.startswith('cdn.') or host.endswith(CDN_SUFFIXES):
                 return 'cdn'
             return 'external'
-        elif url.startswith(('mailto:', 'tel:', 'javascript:')):
+        elif url.startswith(SKIP_SCHEMES):
             return 'skip'
         else:
             return 'local'
 
 
+# Link-carrying attribute per element, as handled by LinkExtractor
+LINK_ATTRS = {'a': 'href', 'img': 'src', 'link': 'href', 'script': 'src'}
+
+
+def extract_links_lxml(content: bytes, source_file: str) -> List[Link]:
+    """Extract links with lxml's streaming HTML parser.
+
+    Elements are read on their start event and cleared on their end event,
+    so the full tree is never kept in memory.
+    """
+    links: List[Link] = []
+    for event, elem in etree.iterparse(io.BytesIO(content), events=('start', 'end'),
+                                       html=True, encoding='utf-8'):
+        if event == 'end':
+            elem.clear()
+            # Drop already-processed siblings to bound memory
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            continue
+        attr = LINK_ATTRS.get(elem.tag) if isinstance(elem.tag, str) else None
+        url = elem.get(attr) if attr else None
+        if url is not None:
+            links.append(Link(
+                url=url,
+                source_file=source_file,
+                line_number=elem.sourceline,
+                link_type=LinkExtractor._classify_link(url),
+                element=elem.tag
+            ))
+    return links
+
+
+def extract_links(file_path: Path, source_file: str, content: Optional[bytes] = None) -> List[Link]:
+    """Extract all links from an HTML file, with lxml when available.
+
+    ``content`` is the file's bytes when the caller has already read them.
+    """
+    if content is None:
+        content = file_path.read_bytes()
+    if HAS_LXML:
+        return extract_links_lxml(content, source_file)
+
+    extractor = LinkExtractor(source_file)
+    extractor.feed(content.decode('utf-8'))
+    return extractor.links
+
+
+# Bump when extraction or classification changes, so old cached links are dropped
+LINK_CACHE_VERSION = 2
+
+# Relative path -> (sha256 hex of content, links as [url, source_file, line_number,
+# link_type, element] lists). Stored as JSON: the file sits inside the checked-out
+# tree, so it must be plain data that cannot run code when loaded
+LinkCache = Dict[str, Tuple[str, List[list]]]
+
+_LINK_FIELD_TYPES = (str, str, int, str, str)
+
+
+def _valid_link_fields(fields) -> bool:
+    return (isinstance(fields, list) and len(fields) == len(_LINK_FIELD_TYPES)
+            and all(type(v) is t for v, t in zip(fields, _LINK_FIELD_TYPES)))
+
+
+def load_link_cache(cache_path: Path) -> LinkCache:
+    """Load the relative path -> (sha256, links) cache, or start empty.
+
+    Anything unreadable or not in the expected shape is treated as a miss.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != LINK_CACHE_VERSION:
+        return {}
+    files = data.get('files')
+    if not isinstance(files, dict):
+        return {}
+    cache = {}
+    for relative_path, entry in files.items():
+        if (isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str)
+                and isinstance(entry[1], list) and all(map(_valid_link_fields, entry[1]))):
+            cache[relative_path] = (entry[0], entry[1])
+    return cache
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data through a temp file in the same directory, then rename over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_link_cache(cache_path: Path, cache: LinkCache) -> None:
+    """Write the cache atomically, so an interrupted run never leaves half a file."""
+    try:
+        data = {'version': LINK_CACHE_VERSION, 'files': cache}
+        atomic_write(cache_path, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+    except OSError as e:
+        # Caching is best effort; the next run just parses everything again
+        print(f"Warning: could not save link cache: {e}", file=sys.stderr)
+
+
 # =============================================================================
 # CHECKERS
 # =============================================================================
@@ -142,25 +312,35 @@ class LinkExtractor(html.parser.HTMLParser):
 class LocalFileChecker:
     """Check if local file references exist."""
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, follow_symlinks: bool = False):
         self.base_path = base_path
+        self.follow_symlinks = follow_symlinks
+        # Joined target path -> (normalized path, exists); shared assets are linked
+        # from many pages, so each distinct target is normalized and stat'ed once
+        self._target_cache: Dict[str, Tuple[Path, bool]] = {}
 
     def check(self, link: Link) -> CheckResult:
         if link.link_type != 'local':
             return CheckResult(link=link, valid=True, error="Not a local link")
 
         # Resolve relative path from source file location
-        source_dir = Path(link.source_file).parent
-        target_path = self.base_path / source_dir / link.url
-
-        # Normalize path (handle ../ etc)
-        try:
-            target_path = target_path.resolve()
-        except (OSError, ValueError) as e:
-            return CheckResult(link=link, valid=False, error=f"Invalid path: {e}")
+        key = os.path.join(self.base_path, os.path.dirname(link.source_file), link.url)
+        cached = self._target_cache.get(key)
+        if cached is None:
+            # Normalize path (handle ../ etc). Lexical normpath needs no syscalls;
+            # resolve() stats every component, which only matters for symlinked dirs
+            if self.follow_symlinks:
+                try:
+                    target_path = Path(key).resolve()
+                except (OSError, ValueError) as e:
+                    return CheckResult(link=link, valid=False, error=f"Invalid path: {e}")
+            else:
+                target_path = Path(os.path.normpath(key))
+            cached = self._target_cache[key] = (target_path, target_path.exists())
+        target_path, exists = cached
 
         # Check existence
-        if target_path.exists():
+        if exists:
             return CheckResult(link=link, valid=True)
         else:
             # Try to show relative path for clearer error
@@ -181,6 +361,7 @@ class FragmentChecker:
 
     def __init__(self, base_path: Path):
         self.base_path = base_path
+        self._raw_cache: Dict[str, Optional[bytes]] = {}
         self._id_cache: Dict[str, Set[str]] = {}
 
     def check(self, link: Link) -> CheckResult:
@@ -189,7 +370,15 @@ class FragmentChecker:
 
         fragment = link.url.lstrip('#')
 
-        # Get IDs from same file
+        # Fast path: the usual ' id="name"' spelling is a plain substring test on
+        # the raw bytes, with no id scan at all
+        content = self._read(link.source_file)
+        if content is not None:
+            needle = fragment.encode('utf-8')
+            if b' id="' + needle + b'"' in content or b" id='" + needle + b"'" in content:
+                return CheckResult(link=link, valid=True)
+
+        # Otherwise get all IDs from the same file (other spellings, or missing)
         ids = self._get_ids(link.source_file)
 
         if fragment in ids:
@@ -206,31 +395,255 @@ class FragmentChecker:
         if file_path in self._id_cache:
             return self._id_cache[file_path]
 
-        full_path = self.base_path / file_path
-        if not full_path.exists():
+        content = self._read(file_path)
+        if content is None:
             return set()
 
-        with open(full_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Simple regex to find id attributes
-        ids = set(re.findall(r'id=["\']([^"\']+)["\']', content))
+        # Scanned as raw bytes; only the matched ids are decoded
+        ids = {(dq or sq or bare).decode('utf-8', 'replace')
+               for dq, sq, bare in ID_ATTR_RE.findall(content)}
         self._id_cache[file_path] = ids
         return ids
 
+    def add_source(self, file_path: str, content: bytes):
+        """Register bytes the caller already read, so the file is not read again."""
+        self._raw_cache[file_path] = content
+
+    def _read(self, file_path: str) -> Optional[bytes]:
+        """Raw bytes of an HTML file, read once per run; None if it does not exist."""
+        if file_path not in self._raw_cache:
+            try:
+                with open(self.base_path / file_path, 'rb') as f:
+                    self._raw_cache[file_path] = f.read()
+            except FileNotFoundError:
+                self._raw_cache[file_path] = None
+        return self._raw_cache[file_path]
+
 
 class ExternalChecker:
     """Check HTTP status of external URLs."""
 
-    def __init__(self, timeout: int = 10):
+    # Default number of in-flight requests when prefetching a batch of URLs:
+    # each thread holds a stack, while a pending coroutine costs a few KB
+    DEFAULT_WORKERS = 16
+    DEFAULT_ASYNC_WORKERS = 100
+    # In-flight requests to any one host, so a burst does not trip rate limiters
+    MAX_PER_HOST = 6
+    # Statuses from servers that refuse HEAD; these URLs are retried with a GET
+    HEAD_REJECTED = frozenset({403, 405, 501})
+    USER_AGENT = 'Mozilla/5.0 LinkChecker'
+    # Sent with every request. identity keeps a GET fallback from being served
+    # a compressed body, which is never read anyway
+    HEADERS = {'User-Agent': USER_AGENT, 'Accept': '*/*', 'Accept-Encoding': 'identity'}
+    # An unreachable host is given up on sooner than a slow response
+    CONNECT_TIMEOUT = 5
+    # URLs that passed are trusted for this long (seconds) by later runs
+    URL_CACHE_TTL = 24 * 3600
+    # Consecutive connection failures after which a host is treated as down
+    HOST_FAIL_LIMIT = 3
+
+    def __init__(self, timeout: int = 10, workers: Optional[int] = None,
+                 use_async: Optional[bool] = None,
+                 cache_path: Optional[Path] = None, ttl: float = URL_CACHE_TTL):
         self.timeout = timeout
+        # (connect, read) for requests, built once rather than per call
+        self._timeout = (min(timeout, self.CONNECT_TIMEOUT), timeout)
+        # Batches go through aiohttp when it is installed, unless turned off
+        # (and the requests thread pool is there to fall back on)
+        self.use_async = HAS_AIOHTTP and (use_async is not False or not HAS_REQUESTS)
+        if workers is None:
+            workers = self.DEFAULT_ASYNC_WORKERS if self.use_async else self.DEFAULT_WORKERS
+        self.workers = max(1, workers)
+        # Only written from the calling thread: workers return statuses, prefetch stores them
         self._cache: Dict[str, Tuple[bool, Optional[str]]] = {}
+        self.session = self._make_session() if HAS_REQUESTS else None
+        # Per-host circuit breaker: once connecting to a host has failed (refused,
+        # unresolvable, connect timeout) HOST_FAIL_LIMIT times in a row, its remaining
+        # URLs fail fast instead of each waiting out the timeout. Any response resets
+        # the count; errors after a connection was made (read timeouts) leave it alone
+        self._host_failures: Dict[str, int] = {}
+        self._host_dead: Set[str] = set()
+        self._host_lock = threading.Lock()
+
+        # Cross-run cache of good URLs -> time they were checked. Failures are
+        # never persisted, so a fixed link or a transient outage is re-checked
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self._checked_at: Dict[str, float] = {}
+        if cache_path:
+            self._load_url_cache()
+
+    def _load_url_cache(self):
+        """Seed the in-memory cache with URLs that passed within the TTL"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, dict):
+            return
+        cutoff = time.time() - self.ttl
+        for url, checked_at in entries.items():
+            if isinstance(checked_at, (int, float)) and checked_at >= cutoff:
+                self._checked_at[url] = checked_at
+                self._cache[url] = (True, None)
+
+    def save_url_cache(self):
+        """Persist the good URLs for the next run (best effort)"""
+        if not self.cache_path:
+            return
+        now = time.time()
+        for url, (valid, _) in self._cache.items():
+            if valid and url not in self._checked_at:
+                self._checked_at[url] = now
+        try:
+            atomic_write(self.cache_path, json.dumps(self._checked_at, indent=1).encode('utf-8'))
+        except OSError as e:
+            print(f"Warning: could not save URL cache: {e}", file=sys.stderr)
+
+    def _make_session(self) -> 'requests.Session':
+        """Pooled session: connections (and TLS) to a host are reused across URLs."""
+        session = requests.Session()
+        session.headers.update(self.HEADERS)
+        # Transient 5xx answers are retried; the final status is still reported.
+        # Connect errors are retried too, so one failure counted by the circuit
+        # breaker can already have cost up to 3 x CONNECT_TIMEOUT. Read errors are
+        # not: a server that accepted the connection and then stalled is unlikely
+        # to answer the next time, and read=False raises ReadTimeout itself
+        # rather than wrapping it in a ConnectionError
+        retry = Retry(total=2, read=False, backoff_factor=0.3,
+                      status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+        # One pool per host, each capped at MAX_PER_HOST connections; pool_block makes
+        # further requests to that host wait for a free connection instead of opening more
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.MAX_PER_HOST,
+                              pool_block=True, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def prefetch(self, urls: Iterable[str]):
+        """Check many URLs concurrently and fill the cache, so check() is a lookup.
+
+        Uses one aiohttp session when use_async is set, else requests in a thread pool.
+        """
+        pending = [url for url in dict.fromkeys(urls) if url not in self._cache]
+        if not pending:
+            return
+        # Interleave hosts, so workers waiting on one busy host's limit do not
+        # hold up URLs on the others
+        by_host: Dict[str, List[str]] = {}
+        for url in pending:
+            by_host.setdefault(urllib.parse.urlsplit(url).netloc, []).append(url)
+        pending = [url for batch in itertools.zip_longest(*by_host.values())
+                   for url in batch if url is not None]
+        if self.use_async:
+            statuses = asyncio.run(self._fetch_all_async(pending))
+        elif HAS_REQUESTS:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as ex:
+                statuses = list(ex.map(self._fetch_status, pending))
+        else:
+            return
+        self._cache.update(zip(pending, statuses))
+
+    def _host_down(self, netloc: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """Result for a URL on a host that is marked dead, else None"""
+        if netloc in self._host_dead:
+            return False, f"Host unreachable ({self.HOST_FAIL_LIMIT} failed requests)"
+        return None
+
+    def _record_host(self, netloc: str, reachable: bool):
+        """Update the circuit breaker after a request to netloc"""
+        with self._host_lock:
+            if reachable:
+                self._host_failures.pop(netloc, None)
+                return
+            failures = self._host_failures.get(netloc, 0) + 1
+            self._host_failures[netloc] = failures
+            if failures >= self.HOST_FAIL_LIMIT:
+                self._host_dead.add(netloc)
+
+    async def _fetch_all_async(self, urls: List[str]) -> List[Tuple[bool, Optional[str]]]:
+        sem = asyncio.Semaphore(self.workers)
+        connector = aiohttp.TCPConnector(limit=self.workers, limit_per_host=self.MAX_PER_HOST)
+        timeout = aiohttp.ClientTimeout(total=self.timeout,
+                                        sock_connect=min(self.timeout, self.CONNECT_TIMEOUT))
+        # The timeout clock starts when a request is issued, so a URL must not sit
+        # in the connector waiting for one of its host's MAX_PER_HOST connections:
+        # each host's semaphore is taken before the global one, leaving the
+        # connector with a free connection for every request it is given
+        netlocs = [urllib.parse.urlsplit(url).netloc for url in urls]
+        host_sems = {netloc: asyncio.Semaphore(self.MAX_PER_HOST) for netloc in netlocs}
+        async with aiohttp.ClientSession(connector=connector, headers=self.HEADERS,
+                                         timeout=timeout) as session:
+            return await asyncio.gather(*[
+                self._fetch_status_async(session, sem, host_sems[netloc], netloc, url)
+                for url, netloc in zip(urls, netlocs)
+            ])
+
+    async def _fetch_status_async(self, session, sem, host_sem, netloc: str,
+                                  url: str) -> Tuple[bool, Optional[str]]:
+        try:
+            async with host_sem, sem:
+                # Checked after the wait, so URLs queued behind a dying host see its verdict
+                down = self._host_down(netloc)
+                if down:
+                    return down
+                async with session.head(url, allow_redirects=True) as response:
+                    status = response.status
+                if status in self.HEAD_REJECTED:
+                    # Leaving the block drops the connection without reading the body
+                    async with session.get(url, allow_redirects=True) as response:
+                        status = response.status
+        except asyncio.TimeoutError as e:
+            if isinstance(e, AIOHTTP_CONNECT_ERRORS):
+                self._record_host(netloc, False)
+            return False, "Request timeout"
+        except aiohttp.ClientError as e:
+            if isinstance(e, AIOHTTP_CONNECT_ERRORS):
+                self._record_host(netloc, False)
+            return False, f"Request failed: {str(e)}"
+        self._record_host(netloc, True)
+        if status < 400:
+            return True, None
+        return False, f"HTTP {status}"
+
+    def _fetch_status(self, url: str) -> Tuple[bool, Optional[str]]:
+        netloc = urllib.parse.urlsplit(url).netloc
+        down = self._host_down(netloc)
+        if down:
+            return down
+        try:
+            response = self.session.head(
+                url,
+                timeout=self._timeout,
+                allow_redirects=True
+            )
+            if response.status_code in self.HEAD_REJECTED:
+                # stream=True stops after the headers; closing skips the body
+                with self.session.get(url, timeout=self._timeout, allow_redirects=True,
+                                      stream=True) as response:
+                    pass
+
+        # ConnectionError covers ConnectTimeout but not ReadTimeout
+        except requests.exceptions.Timeout as e:
+            if isinstance(e, requests.exceptions.ConnectionError):
+                self._record_host(netloc, False)
+            return False, "Request timeout"
+        except requests.exceptions.RequestException as e:
+            if isinstance(e, requests.exceptions.ConnectionError):
+                self._record_host(netloc, False)
+            return False, f"Request failed: {str(e)}"
+
+        self._record_host(netloc, True)
+        if response.status_code < 400:
+            return True, None
+        return False, f"HTTP {response.status_code}"
 
     def check(self, link: Link) -> CheckResult:
         if link.link_type not in ('external', 'cdn'):
             return CheckResult(link=link, valid=True, error="Not external")
 
-        if not HAS_REQUESTS:
+        if not HAS_REQUESTS and not HAS_AIOHTTP:
             return CheckResult(
                 link=link,
                 valid=True,
@@ -238,34 +651,13 @@ class ExternalChecker:
             )
 
         # Check cache first
-        if link.url in self._cache:
-            valid, error = self._cache[link.url]
-            return CheckResult(link=link, valid=valid, error=error)
-
-        try:
-            response = requests.head(
-                link.url,
-                timeout=self.timeout,
-                allow_redirects=True,
-                headers={'User-Agent': 'Mozilla/5.0 LinkChecker'}
-            )
-
-            if response.status_code < 400:
-                self._cache[link.url] = (True, None)
-                return CheckResult(link=link, valid=True)
+        if link.url not in self._cache:
+            if HAS_REQUESTS:
+                self._cache[link.url] = self._fetch_status(link.url)
             else:
-                error = f"HTTP {response.status_code}"
-                self._cache[link.url] = (False, error)
-                return CheckResult(link=link, valid=False, error=error)
-
-        except requests.exceptions.Timeout:
-            error = "Request timeout"
-            self._cache[link.url] = (False, error)
-            return CheckResult(link=link, valid=False, error=error)
-        except requests.exceptions.RequestException as e:
-            error = f"Request failed: {str(e)}"
-            self._cache[link.url] = (False, error)
-            return CheckResult(link=link, valid=False, error=error)
+                self.prefetch([link.url])
+        valid, error = self._cache[link.url]
+        return CheckResult(link=link, valid=valid, error=error)
 
 
 # =============================================================================
@@ -275,32 +667,38 @@ class ExternalChecker:
 class Reporter:
     """Generate console output for check results."""
 
+    COLORS = {
+        'red': '\033[91m',
+        'green': '\033[92m',
+        'yellow': '\033[93m',
+        'blue': '\033[94m',
+        'reset': '\033[0m'
+    }
+
     def __init__(self, verbose: bool = False, color: bool = True):
         self.verbose = verbose
         self.use_color = color and sys.stdout.isatty()
+        # Status tags are colored once here, not on every result line
+        self._ok_tag = self._color('[OK]', 'green')
+        self._broken_tag = self._color('[BROKEN]', 'red')
+        self._passed_tag = self._color('PASSED', 'green')
+        self._failed_tag = self._color('FAILED', 'red')
 
     def _color(self, text: str, code: str) -> str:
         """Apply ANSI color codes to text."""
         if not self.use_color:
             return text
-        colors = {
-            'red': '\033[91m',
-            'green': '\033[92m',
-            'yellow': '\033[93m',
-            'blue': '\033[94m',
-            'reset': '\033[0m'
-        }
-        return f"{colors.get(code, '')}{text}{colors['reset']}"
-
-    def print_result(self, result: CheckResult):
-        """Print a single check result."""
+        return f"{self.COLORS.get(code, '')}{text}{self.COLORS['reset']}"
+
+    def format_result(self, result: CheckResult) -> str:
+        """Output lines for a single check result ('' when there is nothing to show)."""
         if result.valid:
             if self.verbose:
-                print(f"  {self._color('[OK]', 'green')} {result.link.url}")
-        else:
-            print(f"  {self._color('[BROKEN]', 'red')} {result.link.url}")
-            print(f"    Source: {result.link.source_file}:{result.link.line_number}")
-            print(f"    Error: {result.error}")
+                return f"  {self._ok_tag} {result.link.url}\n"
+            return ''
+        return (f"  {self._broken_tag} {result.link.url}\n"
+                f"    Source: {result.link.source_file}:{result.link.line_number}\n"
+                f"    Error: {result.error}\n")
 
     def print_summary(self, summary: Summary):
         """Print final summary statistics."""
@@ -315,9 +713,9 @@ class Reporter:
         print("=" * 60)
 
         if summary.broken_links > 0:
-            print(f"\n{self._color('FAILED', 'red')}: {summary.broken_links} broken link(s) found")
+            print(f"\n{self._failed_tag}: {summary.broken_links} broken link(s) found")
         else:
-            print(f"\n{self._color('PASSED', 'green')}: All links valid")
+            print(f"\n{self._passed_tag}: All links valid")
 
 
 # =============================================================================
@@ -332,16 +730,27 @@ class LinkChecker:
         base_path: Path,
         check_external: bool = False,
         verbose: bool = False,
-        no_color: bool = False
+        no_color: bool = False,
+        cache_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+        use_async: Optional[bool] = None,
+        url_cache_path: Optional[Path] = None,
+        url_cache_ttl: float = ExternalChecker.URL_CACHE_TTL,
+        follow_symlinks: bool = False
     ):
         self.base_path = base_path
         self.check_external = check_external
         self.verbose = verbose
+        self.cache_path = cache_path
 
-        self.local_checker = LocalFileChecker(base_path)
+        self.local_checker = LocalFileChecker(base_path, follow_symlinks=follow_symlinks)
         self.fragment_checker = FragmentChecker(base_path)
-        self.external_checker = ExternalChecker() if check_external else None
+        self.external_checker = ExternalChecker(
+            workers=workers, use_async=use_async, cache_path=url_cache_path, ttl=url_cache_ttl
+        ) if check_external else None
         self.reporter = Reporter(verbose=verbose, color=not no_color)
+        # Verdict per link key (see _verdict_key), shared by every page of the run
+        self._verdicts: Dict[Tuple[str, ...], Tuple[bool, Optional[str]]] = {}
 
     def find_html_files(self) -> List[Path]:
         """Find all HTML files to check."""
@@ -352,32 +761,80 @@ class LinkChecker:
         if index.exists():
             html_files.append(index)
 
-        # Quiz files
-        quiz_dir = self.base_path / 'quiz'
-        if quiz_dir.exists():
-            html_files.extend(sorted(quiz_dir.glob('*.html')))
+        # Quiz files: one scandir, names filtered as strings, Paths built only for matches
+        try:
+            with os.scandir(self.base_path / 'quiz') as it:
+                quiz_pages = sorted(e.path for e in it if e.name.endswith('.html') and e.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            quiz_pages = []
+        html_files.extend(map(Path, quiz_pages))
 
         return html_files
 
-    def check_file(self, file_path: Path) -> List[CheckResult]:
-        """Check all links in a single HTML file."""
-        relative_path = file_path.relative_to(self.base_path)
+    def extract_all(self, html_files: List[Path]) -> Dict[Path, List[Link]]:
+        """Extract links from every file, reusing cached links for unchanged content.
 
-        print(f"\nChecking: {relative_path}")
+        Each file is read once: the same bytes are hashed, parsed on a cache miss
+        and handed to the fragment checker.
+        """
+        cache = load_link_cache(self.cache_path) if self.cache_path else {}
+        # Only entries for the files seen this run are written back, so stale ones expire
+        fresh = {}
+        links_by_file = {}
+        for file_path in html_files:
+            relative_path = str(file_path.relative_to(self.base_path))
+            content = file_path.read_bytes()
+            self.fragment_checker.add_source(relative_path, content)
+            digest = hashlib.sha256(content).hexdigest()
+            cached = cache.get(relative_path)
+            if cached is not None and cached[0] == digest:
+                links = [Link(*fields) for fields in cached[1]]
+            else:
+                links = extract_links(file_path, relative_path, content)
+            fresh[relative_path] = (digest, [[link.url, link.source_file, link.line_number,
+                                              link.link_type, link.element] for link in links])
+            links_by_file[file_path] = links
+
+        if self.cache_path and fresh != cache:
+            save_link_cache(self.cache_path, fresh)
+        return links_by_file
+
+    @staticmethod
+    def _verdict_key(link: Link) -> Tuple[str, ...]:
+        """Key under which links always get the same verdict.
+
+        Local URLs resolve against the page's directory and fragments against
+        the page itself; external URLs depend on nothing but the URL.
+        """
+        if link.link_type == 'local':
+            return ('local', os.path.dirname(link.source_file), link.url)
+        if link.link_type == 'fragment':
+            return ('fragment', link.source_file, link.url)
+        return (link.link_type, link.url)
+
+    def check_file(self, file_path: Path, links: Optional[List[Link]] = None) -> List[CheckResult]:
+        """Check all links in a single HTML file (links may be pre-extracted)."""
+        relative_path = file_path.relative_to(self.base_path)
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # The whole file's report goes out in one write instead of a print per line
+        output = [f"\nChecking: {relative_path}\n"]
 
         # Extract links
-        extractor = LinkExtractor(str(relative_path))
-        extractor.feed(content)
+        if links is None:
+            links = extract_links(file_path, str(relative_path))
 
         results = []
-        for link in extractor.links:
+        for link in links:
             if link.link_type == 'skip':
                 continue
 
-            if link.link_type == 'local':
+            # Shared navbars, stylesheets and scripts repeat on every page: reuse
+            # the verdict of an equivalent link and only attach this link to it
+            key = self._verdict_key(link)
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                result = CheckResult(link=link, valid=verdict[0], error=verdict[1])
+            elif link.link_type == 'local':
                 result = self.local_checker.check(link)
             elif link.link_type == 'fragment':
                 result = self.fragment_checker.check(link)
@@ -388,10 +845,12 @@ class LinkChecker:
                     result = CheckResult(link=link, valid=True, error="Skipped")
             else:
                 continue
+            self._verdicts[key] = (result.valid, result.error)
 
             results.append(result)
-            self.reporter.print_result(result)
+            output.append(self.reporter.format_result(result))
 
+        sys.stdout.write(''.join(output))
         return results
 
     def run(self) -> Summary:
@@ -407,19 +866,29 @@ class LinkChecker:
 
         summary = Summary(files_checked=len(html_files))
 
-        for file_path in html_files:
-            results = self.check_file(file_path)
+        links_by_file = self.extract_all(html_files)
+        # Check every distinct external URL of the site concurrently up front
+        if self.external_checker:
+            self.external_checker.prefetch(
+                link.url for links in links_by_file.values() for link in links
+                if link.link_type in ('external', 'cdn')
+            )
 
-            for result in results:
-                summary.total_links += 1
-                summary.results.append(result)
+        for file_path, links in links_by_file.items():
+            summary.results.extend(self.check_file(file_path, links))
 
-                if result.error == "Skipped":
-                    summary.skipped_links += 1
-                elif result.valid:
-                    summary.valid_links += 1
-                else:
-                    summary.broken_links += 1
+        # Tally once at the end instead of bumping counters per result
+        outcomes = Counter(
+            'skipped' if result.error == "Skipped" else 'valid' if result.valid else 'broken'
+            for result in summary.results
+        )
+        summary.total_links = len(summary.results)
+        summary.valid_links = outcomes['valid']
+        summary.broken_links = outcomes['broken']
+        summary.skipped_links = outcomes['skipped']
+
+        if self.external_checker:
+            self.external_checker.save_url_cache()
 
         self.reporter.print_summary(summary)
         return summary
@@ -458,7 +927,39 @@ Examples:
     parser.add_argument(
         '--check-external', '-e',
         action='store_true',
-        help='Also check external URLs (requires requests library)'
+        help='Also check external URLs (requires requests or aiohttp)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help=f'Concurrent external requests (default: {ExternalChecker.DEFAULT_ASYNC_WORKERS} '
+             f'with aiohttp, {ExternalChecker.DEFAULT_WORKERS} with the thread pool)'
+    )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='Check external URLs with aiohttp (default: when installed) '
+             'or, with --no-async, a requests thread pool'
+    )
+    parser.add_argument(
+        '--no-url-cache',
+        action='store_true',
+        help=f'Re-check every external URL instead of trusting ones that passed recently '
+             f'({DEFAULT_URL_CACHE})'
+    )
+    parser.add_argument(
+        '--url-cache-ttl',
+        type=float,
+        default=ExternalChecker.URL_CACHE_TTL / 3600,
+        help='Hours a passing external URL is trusted by later runs (default: %(default)g)'
+    )
+    parser.add_argument(
+        '--follow-symlinks',
+        action='store_true',
+        help='Resolve symlinks in local link targets (default: normalize paths lexically)'
     )
     parser.add_argument(
         '--verbose', '-v',
@@ -470,6 +971,11 @@ Examples:
         action='store_true',
         help='Disable colored output'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not write the extracted-link cache (.cache/links.json)'
+    )
 
     args = parser.parse_args()
 
@@ -483,12 +989,21 @@ Examples:
     if not (base_path / 'index.html').exists():
         print(f"Warning: No index.html found in {base_path}", file=sys.stderr)
 
+    if args.check_external and args.use_async and not HAS_AIOHTTP:
+        print("Warning: aiohttp not installed, checking external URLs with threads", file=sys.stderr)
+
     # Run checker
     checker = LinkChecker(
         base_path=base_path,
         check_external=args.check_external,
         verbose=args.verbose,
-        no_color=args.no_color
+        no_color=args.no_color,
+        cache_path=None if args.no_cache else base_path / '.cache' / 'links.json',
+        workers=args.workers,
+        use_async=args.use_async,
+        url_cache_path=None if args.no_url_cache else DEFAULT_URL_CACHE,
+        url_cache_ttl=args.url_cache_ttl * 3600,
+        follow_symlinks=args.follow_symlinks
     )
 
     summary = checker.run()
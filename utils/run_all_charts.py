@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """Run all chart generation scripts and verify outputs.
 
+Charts run inside this interpreter by default, so matplotlib and numpy are
+imported once for the whole run; --isolate starts a fresh interpreter per chart.
+Charts whose script (and lesson-level _*.py helpers) are unchanged since their
+last successful run, and whose outputs are untouched, are skipped using
+.cache/charts.json; --force re-runs everything.
+
 Usage:
     python utils/run_all_charts.py
     python utils/run_all_charts.py --parallel  # Run in parallel
+    python utils/run_all_charts.py --isolate   # One subprocess per chart
+    python utils/run_all_charts.py --force     # Ignore the up-to-date cache
 """
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import runpy
 import subprocess
 import sys
+import traceback
 from pathlib import Path
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Optional
 
 def find_all_charts(base_dir: Path) -> list[Path]:
     """Find all chart.py files in lesson directories."""
@@ -17,8 +34,87 @@ def find_all_charts(base_dir: Path) -> list[Path]:
     charts = sorted(base_dir.glob("L*/*/chart.py"))
     return charts
 
-def run_chart(chart_path: Path) -> dict:
-    """Run a single chart.py and verify outputs."""
+# Bump when the cache entry layout changes, so old caches are ignored
+CACHE_VERSION = 1
+
+def load_cache(cache_path: Path) -> dict:
+    """Load the chart -> last successful run cache, or start empty."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("charts", {})
+
+def save_cache(cache_path: Path, charts: dict):
+    """Write the cache through a temp file and rename, so a crash never leaves half a file."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "charts": charts}, indent=1),
+                            encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not save chart cache: {e}", file=sys.stderr)
+
+def source_hash(chart_path: Path) -> str:
+    """Hash of chart.py plus the shared _*.py helpers in its lesson directory."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in [chart_path, *sorted(chart_path.parent.parent.glob("_*.py"))]:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def output_stamp(chart_dir: Path) -> Optional[list]:
+    """[pdf mtime_ns, png mtime_ns], or None if either output is missing."""
+    try:
+        return [os.stat(chart_dir / "chart.pdf").st_mtime_ns,
+                os.stat(chart_dir / "chart.png").st_mtime_ns]
+    except OSError:
+        return None
+
+def run_in_process(chart_path: Path) -> Optional[str]:
+    """Execute chart.py as __main__ in this interpreter; return an error message or None.
+
+    rcParams and sys.path are restored and every figure is closed afterwards,
+    so one chart's settings cannot leak into the next.
+    """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+
+    saved_path = sys.path[:]
+    output = io.StringIO()
+    try:
+        with matplotlib.rc_context(), contextlib.redirect_stdout(output), \
+                contextlib.redirect_stderr(output):
+            runpy.run_path(str(chart_path), run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return f"Exited with status {e.code}"
+    except Exception as e:
+        return "".join(traceback.format_exception_only(type(e), e)).strip()[:500]
+    finally:
+        plt.close('all')
+        sys.path[:] = saved_path
+    return None
+
+def make_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool for in-process rendering, one interpreter (and pyplot) per worker.
+
+    Where available the workers fork from a forkserver that has already imported
+    numpy and pyplot, so those imports are paid once rather than once per worker.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["numpy", "matplotlib.pyplot"])
+    else:
+        ctx = multiprocessing.get_context()
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+
+def run_chart(chart_path: Path, isolate: bool = False) -> dict:
+    """Run a single chart.py (in-process, or in a subprocess if isolate) and verify outputs."""
     chart_dir = chart_path.parent
     result = {
         "path": str(chart_path),
@@ -30,17 +126,23 @@ def run_chart(chart_path: Path) -> dict:
 
     try:
         # Run the chart script
-        proc = subprocess.run(
-            [sys.executable, str(chart_path)],
-            cwd=str(chart_dir),
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if proc.returncode != 0:
-            result["error"] = proc.stderr[:500] if proc.stderr else "Unknown error"
-            return result
+        if isolate:
+            proc = subprocess.run(
+                [sys.executable, str(chart_path)],
+                cwd=str(chart_dir),
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+
+            if proc.returncode != 0:
+                result["error"] = proc.stderr[:500] if proc.stderr else "Unknown error"
+                return result
+        else:
+            error = run_in_process(chart_path)
+            if error:
+                result["error"] = error
+                return result
 
         # Check outputs exist
         pdf_path = chart_dir / "chart.pdf"
@@ -69,6 +171,10 @@ def main():
     parser = argparse.ArgumentParser(description="Run all chart generation scripts")
     parser.add_argument("--parallel", "-p", action="store_true", help="Run in parallel")
     parser.add_argument("--workers", "-w", type=int, default=4, help="Number of parallel workers")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run each chart in its own interpreter (with a 60s timeout)")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Re-run every chart, even if it is up to date")
     args = parser.parse_args()
 
     # Find base directory (parent of utils)
@@ -76,14 +182,39 @@ def main():
 
     print(f"Searching for charts in: {base_dir}")
     charts = find_all_charts(base_dir)
-    print(f"Found {len(charts)} chart files\n")
+    print(f"Found {len(charts)} chart files")
 
+    # Skip charts whose sources match the last successful run and whose outputs
+    # still carry that run's mtimes: a hash and two stats instead of a render
+    cache_path = base_dir / ".cache" / "charts.json"
+    cache = {} if args.force else load_cache(cache_path)
+    new_cache = {}
+    hashes = {}
     results = []
+    pending = []
+    for chart in charts:
+        key = chart.relative_to(base_dir).as_posix()
+        hashes[chart] = source_hash(chart)
+        entry = cache.get(key)
+        stamp = output_stamp(chart.parent)
+        if entry and stamp and entry["hash"] == hashes[chart] and entry["outputs"] == stamp:
+            new_cache[key] = entry
+            results.append({"path": str(chart), "success": True, "pdf_exists": True,
+                            "png_exists": True, "error": None})
+        else:
+            pending.append(chart)
+    print(f"Up to date: {len(charts) - len(pending)}, to run: {len(pending)}\n")
 
     if args.parallel:
         print(f"Running in parallel with {args.workers} workers...\n")
-        with ThreadPoolExecutor(max_workers=args.workers) as executor:
-            futures = {executor.submit(run_chart, chart): chart for chart in charts}
+        # pyplot state is global to an interpreter, so in-process rendering is spread
+        # over worker processes; with --isolate, threads just wait on subprocesses
+        if args.isolate:
+            executor = ThreadPoolExecutor(max_workers=args.workers)
+        else:
+            executor = make_process_pool(args.workers)
+        with executor:
+            futures = {executor.submit(run_chart, chart, args.isolate): chart for chart in pending}
             for future in as_completed(futures):
                 result = future.result()
                 results.append(result)
@@ -93,15 +224,23 @@ def main():
                     print(f"       Error: {result['error']}")
     else:
         print("Running sequentially...\n")
-        for chart in charts:
+        for chart in pending:
             print(f"Running: {chart}...", end=" ", flush=True)
-            result = run_chart(chart)
+            result = run_chart(chart, args.isolate)
             results.append(result)
             status = "OK" if result["success"] else "FAIL"
             print(status)
             if result["error"]:
                 print(f"  Error: {result['error']}")
 
+    # Record this run's successes for the next one
+    succeeded = {r["path"] for r in results if r["success"]}
+    for chart in pending:
+        stamp = output_stamp(chart.parent)
+        if stamp and str(chart) in succeeded:
+            new_cache[chart.relative_to(base_dir).as_posix()] = {"hash": hashes[chart], "outputs": stamp}
+    save_cache(cache_path, new_cache)
+
     # Summary
     print("\n" + "="*60)
     print("SUMMARY")
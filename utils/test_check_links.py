@@ -0,0 +1,111 @@
+"""
+Tests for check_links.ExternalChecker against a local HTTP server.
+
+Run with: python -m pytest utils/test_check_links.py
+"""
+
+import http.server
+import threading
+import time
+import unittest
+
+import check_links
+from check_links import ExternalChecker
+
+
+class SlowHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every HEAD with 200 after a fixed delay."""
+
+    protocol_version = 'HTTP/1.1'
+    delay = 0.2
+
+    def do_HEAD(self):
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def handle(self):
+        # Clients that time out drop the connection mid-request
+        try:
+            super().handle()
+        except ConnectionError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class SlowHostTest(unittest.TestCase):
+    """Many URLs on one slow host must not time out while queued for a connection.
+
+    80 URLs at 0.2 s each through MAX_PER_HOST connections take ~2.7 s in total,
+    well over the 1 s timeout, but every single request finishes in 0.2 s.
+    """
+
+    URL_COUNT = 80
+    TIMEOUT = 1
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.urls = [f"http://127.0.0.1:{cls.server.server_port}/page{i}"
+                    for i in range(cls.URL_COUNT)]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _check_all_valid(self, use_async: bool):
+        checker = ExternalChecker(timeout=self.TIMEOUT, use_async=use_async)
+        checker.prefetch(self.urls)
+        failures = [(url, checker._cache[url]) for url in self.urls if not checker._cache[url][0]]
+        self.assertEqual(failures, [])
+        self.assertEqual(checker._host_dead, set())
+
+    @unittest.skipUnless(check_links.HAS_AIOHTTP, 'aiohttp not installed')
+    def test_async(self):
+        self._check_all_valid(use_async=True)
+
+    @unittest.skipUnless(check_links.HAS_REQUESTS, 'requests not installed')
+    def test_threads(self):
+        self._check_all_valid(use_async=False)
+
+
+class ReadTimeoutTest(unittest.TestCase):
+    """A host that accepts connections but answers too slowly is not marked dead."""
+
+    TIMEOUT = 0.5
+
+    @classmethod
+    def setUpClass(cls):
+        handler = type('StallingHandler', (SlowHandler,), {'delay': 1.0})
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.urls = [f"http://127.0.0.1:{cls.server.server_port}/page{i}"
+                    for i in range(ExternalChecker.HOST_FAIL_LIMIT + 2)]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _check_timeouts(self, use_async: bool):
+        checker = ExternalChecker(timeout=self.TIMEOUT, use_async=use_async)
+        checker.prefetch(self.urls)
+        self.assertEqual({checker._cache[url] for url in self.urls}, {(False, "Request timeout")})
+        self.assertEqual(checker._host_dead, set())
+
+    @unittest.skipUnless(check_links.HAS_AIOHTTP, 'aiohttp not installed')
+    def test_async(self):
+        self._check_timeouts(use_async=True)
+
+    @unittest.skipUnless(check_links.HAS_REQUESTS, 'requests not installed')
+    def test_threads(self):
+        self._check_timeouts(use_async=False)
+
+
+if __name__ == '__main__':
+    unittest.main()